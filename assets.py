@@ -0,0 +1,50 @@
+import io
+import os
+
+import streamlit as st
+from PIL import Image
+
+from profiler import timed
+
+# Static assets are read once per process and cached on (path, mtime), so an
+# edited file is picked up on the next rerun without restarting the server.
+
+
+@st.cache_data(show_spinner=False)
+def _read_text(path, mtime):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+@st.cache_data(show_spinner=False)
+def _read_image(path, mtime, width, fmt):
+    with open(path, "rb") as f:
+        data = f.read()
+    if width is None and fmt is None:
+        return data
+    image = Image.open(io.BytesIO(data))
+    if width is not None and image.width > width:
+        image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+    out = io.BytesIO()
+    image.save(out, format=fmt or image.format or "PNG", quality=85)
+    return out.getvalue()
+
+
+def load_text(path):
+    with timed(f"asset:{path}"):
+        return _read_text(path, os.path.getmtime(path))
+
+
+# Encoded image bytes, optionally downscaled to `width` pixels and/or
+# re-encoded (e.g. fmt="WEBP")
+def load_image(path, width=None, fmt=None):
+    with timed(f"asset:{path}"):
+        return _read_image(path, os.path.getmtime(path), width, fmt)
+
+
+def inject_css(path="styles.css"):
+    st.markdown(f"<style>{load_text(path)}</style>", unsafe_allow_html=True)
+
+
+def show_image(path, width=None, fmt=None, **kwargs):
+    st.image(load_image(path, width, fmt), **kwargs)
@@ -0,0 +1,19 @@
+from passwords import hash_password, verify_password
+from rate_limit import get_login_limiter
+
+
+# Checks a login attempt; returns None on success or the error to show.
+# Throttled attempts are rejected before any password hash is computed.
+def authenticate(user_db, username, password, client, limiter=None):
+    limiter = limiter or get_login_limiter()
+    wait = limiter.acquire(username, client)
+    if wait:
+        return f"Too many login attempts. Please try again in {wait:.0f} seconds."
+    matches, needs_rehash = verify_password(password, user_db.get_password(username))
+    if not matches:
+        return "Invalid username or password."
+    # Upgrade legacy or outdated hashes on successful login
+    if needs_rehash:
+        user_db.set_password(username, hash_password(password))
+    limiter.record_success(username, client)
+    return None
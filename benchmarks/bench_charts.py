@@ -0,0 +1,52 @@
+# Chart payload bytes and server-side latency with and without downsampling
+# Usage: python benchmarks/bench_charts.py [--sizes 10000 1000000 10000000] [--method lttb]
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from charts import MAX_POINTS, downsample
+
+
+# Streamlit ships chart data to the browser as an Arrow IPC stream
+def arrow_bytes(frame):
+    table = pa.Table.from_pandas(frame)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--method", choices=["lttb", "minmax"], default="lttb")
+    parser.add_argument("--max-points", type=int, default=MAX_POINTS)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'points':>10} {'raw bytes':>12} {'raw ms':>8} {'sent bytes':>11} {'sent ms':>8} {'rows':>6}")
+    for n in args.sizes:
+        frame = pd.DataFrame(
+            {"GDP": np.cumsum(rng.standard_normal(n))},
+            index=pd.date_range("2000-01-01", periods=n, freq="min", name="time"),
+        )
+        start = time.perf_counter()
+        raw = arrow_bytes(frame)
+        raw_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        reduced = downsample(frame, max_points=args.max_points, method=args.method)
+        sent = arrow_bytes(reduced)
+        sent_ms = (time.perf_counter() - start) * 1000
+        print(f"{n:>10} {raw:>12} {raw_ms:>8.1f} {sent:>11} {sent_ms:>8.1f} {len(reduced):>6}")
+
+
+if __name__ == "__main__":
+    main()
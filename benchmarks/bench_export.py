@@ -0,0 +1,71 @@
+# Peak memory of exporting the fact table, which should not grow with its size
+# Each export runs in a fresh process so its peak RSS is measured on its own.
+# Usage: python benchmarks/bench_export.py [--rows 1000 1000000 10000000] [--format Parquet]
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+# VmHWM where available: ru_maxrss carries over the parent's peak across exec
+def peak_rss_mb():
+    if os.path.exists("/proc/self/status"):
+        with open("/proc/self/status", encoding="ascii") as f:
+            return next(int(line.split()[1]) for line in f if line.startswith("VmHWM")) / 1024
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def make_data(path, rows):
+    source = pd.read_csv(os.path.join(ROOT, "data", "gdp_city_sector.csv"))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source.head(0).to_csv(index=False))
+        for start in range(0, rows, 1_000_000):
+            n = min(1_000_000, rows - start)
+            f.write(source.iloc[np.arange(n) % len(source)].to_csv(index=False, header=False))
+
+
+# Runs in the child process: export everything and report size, time and RSS
+def child(path, fmt):
+    from export import export
+
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    with tempfile.TemporaryFile() as out:
+        export(fmt, out, path=path)
+        size = out.tell()
+    print(f"{size} {time.perf_counter() - start:.2f} {baseline:.1f} {peak_rss_mb():.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 1_000_000, 10_000_000])
+    parser.add_argument("--format", default="Parquet")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(*args.child)
+        return
+
+    print(f"{'rows':>11} {'file MB':>8} {'seconds':>8} {'import MB':>10} {'peak MB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = os.path.join(tmp, "data.csv")
+            make_data(path, rows)
+            out = subprocess.run([sys.executable, __file__, "--child", path, args.format],
+                                 capture_output=True, text=True, check=True, cwd=ROOT)
+            size, seconds, baseline, peak = out.stdout.split()
+            print(f"{rows:>11,} {int(size) / 2**20:>8.1f} {seconds:>8} {baseline:>10} {peak:>8}")
+
+
+if __name__ == "__main__":
+    main()
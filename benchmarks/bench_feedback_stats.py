@@ -0,0 +1,59 @@
+# Cold aggregation vs incremental refresh of the feedback log
+# Usage: python benchmarks/bench_feedback_stats.py [--records 1000000] [--appends 1000]
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from feedback_stats import CATEGORIES, FeedbackStats
+
+
+def write_records(path, count, start):
+    rng = random.Random(start)
+    with open(path, "a", encoding="utf-8") as f:
+        for i in range(count):
+            f.write(json.dumps({
+                "user": f"user{rng.randrange(10_000)}",
+                "category": rng.choice(CATEGORIES),
+                "satisfaction": rng.randint(1, 10),
+                "feedback": "Looks good",
+                "timestamp": start + i * 60,
+            }) + "\n")
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--appends", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "feedback.jsonl")
+        write_records(path, args.records, 1_700_000_000)
+        print(f"log: {args.records:,} records, {os.path.getsize(path) / 1e6:.1f} MB")
+
+        stats = FeedbackStats(path)
+        print(f"cold aggregation:        {timed(stats.refresh):9.1f} ms")
+        print(f"refresh, no new data:    {timed(stats.refresh):9.3f} ms")
+
+        write_records(path, args.appends, 1_800_000_000)
+        print(f"refresh, +{args.appends} records: {timed(stats.refresh):9.1f} ms")
+
+        resumed = FeedbackStats(path)
+        print(f"restart from checkpoint: {timed(resumed.refresh):9.3f} ms")
+        assert resumed.total == stats.total == args.records + args.appends
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Chatbot intent matching throughput as the intent set grows
+# Usage: python benchmarks/bench_intents.py [--intents 6 1000 10000] [--messages 50000]
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from intents import IntentMatcher
+
+
+# The shipped intents plus synthetic ones with 5 keywords each
+def build(count, rng):
+    base = IntentMatcher.from_file(os.path.join(ROOT, "data", "intents.json"))
+    intents = list(base.intents)
+    for i in range(max(0, count - len(intents))):
+        keywords = [f"topic{i}x{k}" for k in range(4)] + [f"city{i} report"]
+        intents.append({"name": f"synthetic{i}", "keywords": keywords, "response": f"Answer {i}"})
+    return IntentMatcher(intents, base.default)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--intents", type=int, nargs="+", default=[6, 1000, 10000])
+    parser.add_argument("--messages", type=int, default=50_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    words = ["what", "is", "the", "gdp", "of", "pune", "issue", "with", "jobs", "report", "log", "out", "please"]
+    print(f"{'intents':>8} {'build ms':>9} {'msgs/s':>10}")
+    for count in args.intents:
+        start = time.perf_counter()
+        matcher = build(count, rng)
+        build_ms = (time.perf_counter() - start) * 1000
+        messages = []
+        for _ in range(args.messages):
+            tokens = rng.choices(words, k=rng.randint(3, 12))
+            if count > 6 and rng.random() < 0.5:
+                tokens.append(f"topic{rng.randrange(count - 6)}x1")
+            messages.append(" ".join(tokens))
+        start = time.perf_counter()
+        for message in messages:
+            matcher.respond(message)
+        rate = len(messages) / (time.perf_counter() - start)
+        print(f"{count:>8} {build_ms:>9.1f} {rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
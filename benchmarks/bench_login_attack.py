@@ -0,0 +1,92 @@
+# Legitimate login latency while a credential-stuffing burst runs, with and
+# without the login rate limiter
+# Usage: python benchmarks/bench_login_attack.py [--seconds 5] [--attackers 8] [--rounds 10]
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import passwords
+from auth import authenticate
+from rate_limit import LoginLimiter
+from user_store import UserStore
+
+
+class NoLimit:
+    def acquire(self, username, client):
+        return 0.0
+
+    def record_success(self, username, client):
+        pass
+
+
+def run(limiter, store, seconds, attackers):
+    stop = threading.Event()
+    counts = {"attempts": 0, "rejected": 0}
+    counts_lock = threading.Lock()
+
+    def attacker(n):
+        i = 0
+        while not stop.is_set():
+            error = authenticate(store, f"victim{i % 5000}", "hunter2", f"10.0.0.{n % 2}", limiter)
+            with counts_lock:
+                counts["attempts"] += 1
+                counts["rejected"] += error is not None and error.startswith("Too many")
+            i += 1
+            # Pace each attacker like a client waiting on HTTP round trips
+            time.sleep(0.001)
+
+    threads = [threading.Thread(target=attacker, args=(n,)) for n in range(attackers)]
+    for t in threads:
+        t.start()
+    latencies, failures = [], 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        failures += authenticate(store, "alice", "correct horse", "192.168.1.7", limiter) is not None
+        latencies.append((time.perf_counter() - start) * 1000)
+        time.sleep(0.05)
+    stop.set()
+    for t in threads:
+        t.join()
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies),
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+        "legit": len(latencies),
+        "failed": failures,
+        **counts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--attackers", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    passwords.BCRYPT_ROUNDS = args.rounds
+    # Every legitimate login pays for the KDF, as after a server restart
+    passwords.VERIFY_CACHE_SIZE = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        store = UserStore(os.path.join(tmp, "users.csv"))
+        store.add_user("alice", passwords.hash_password("correct horse"))
+        for i in range(5000):
+            store.seed(f"victim{i}", store.get_password("alice"))
+
+        print(f"{'limiter':<8} {'legit p50 ms':>12} {'legit p99 ms':>12} {'legit fails':>11} "
+              f"{'attack tries':>12} {'rejected':>9}")
+        for name, limiter in [("off", NoLimit()), ("on", LoginLimiter())]:
+            r = run(limiter, store, args.seconds, args.attackers)
+            print(f"{name:<8} {r['p50']:>12.1f} {r['p99']:>12.1f} {r['failed']:>11} "
+                  f"{r['attempts']:>12} {r['rejected']:>9}")
+
+
+if __name__ == "__main__":
+    main()
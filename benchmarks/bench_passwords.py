@@ -0,0 +1,52 @@
+# Logins per second for a range of bcrypt costs
+# Usage: python benchmarks/bench_passwords.py [--rounds 4 8 10 12] [--logins 20] [--threads 8]
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import passwords
+
+
+def bench(rounds, logins, threads):
+    passwords.BCRYPT_ROUNDS = rounds
+    stored = passwords.hash_password("correct horse", rounds)
+    # Bypass the verification cache so every login pays for the KDF
+    passwords.VERIFY_CACHE_SIZE = 0
+
+    def login(_):
+        return passwords.verify_password("correct horse", stored)[0]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as clients:
+        assert all(clients.map(login, range(logins)))
+    elapsed = time.perf_counter() - start
+
+    passwords.VERIFY_CACHE_SIZE = 1024
+    login(None)
+    cached_start = time.perf_counter()
+    for _ in range(logins):
+        passwords.verify_password("correct horse", stored)
+    cached = time.perf_counter() - cached_start
+    return logins / elapsed, logins / cached
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, nargs="+", default=[4, 8, 10, 12])
+    parser.add_argument("--logins", type=int, default=20)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"hash workers: {passwords.HASH_WORKERS}, client threads: {args.threads}")
+    print(f"{'rounds':>6} {'logins/s':>10} {'cached/s':>12}")
+    for rounds in args.rounds:
+        rate, cached_rate = bench(rounds, args.logins, args.threads)
+        print(f"{rounds:>6} {rate:>10.1f} {cached_rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
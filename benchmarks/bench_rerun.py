@@ -0,0 +1,50 @@
+# Cold vs warm rerun latency for each section of the app
+# Usage: python benchmarks/bench_rerun.py [--runs 20]
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sessions import get_session_manager
+
+SECTIONS = ["Home", "About", "Dashboards", "Insights and Analysis", "Feedback", "Chatbot"]
+
+
+def timed_run(at):
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    assert not at.exception, at.exception
+    return elapsed * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    at = AppTest.from_file(os.path.join(ROOT, "gdpbi.py"), default_timeout=60)
+    at.session_state["session_token"] = get_session_manager().create("admin")
+    timed_run(at)
+
+    print(f"{'section':<24} {'cold ms':>9} {'warm p50':>9} {'warm max':>9}")
+    for section in SECTIONS:
+        at.sidebar.radio[0].set_value(section)
+        cold = []
+        for _ in range(max(1, args.runs // 4)):
+            st.cache_data.clear()
+            cold.append(timed_run(at))
+        warm = [timed_run(at) for _ in range(args.runs)]
+        print(f"{section:<24} {statistics.median(cold):>9.1f} {statistics.median(warm):>9.1f} {max(warm):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+# Headless load test for gdpbi.py using Streamlit's AppTest
+# Each simulated session signs up, logs in, visits every menu section,
+# submits feedback and sends chatbot messages. Reports rerun latency
+# percentiles, throughput and peak RSS, and compares them against a saved
+# baseline. AppTest is not thread-safe, so the N sessions are kept alive
+# together in one server process and their reruns are interleaved
+# round-robin, as a single busy script thread would see them.
+#
+# Usage:
+#   python benchmarks/loadtest.py --sessions 8 --save-baseline
+#   python benchmarks/loadtest.py --sessions 8 --threshold 0.2   # exit 1 on regression
+import argparse
+import json
+import os
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_FILE = os.path.join(ROOT, "benchmarks", "baseline.json")
+CHAT_MESSAGES = ["What features does the dashboard have?", "top 5 cities by gdp growth in 2022",
+                 "services share in Pune", "I found an issue with the GDP tab"]
+# Metrics checked against the baseline, and whether higher is better;
+# p99 is reported but too noisy at small session counts to gate on
+COMPARED = {"p50_ms": False, "p95_ms": False, "peak_rss_mb": False, "reruns_per_s": True}
+
+
+def peak_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+# One session's script; yields after every rerun so sessions can interleave
+def simulate(n, app, latencies):
+    from streamlit.testing.v1 import AppTest
+
+    def run(at):
+        start = time.perf_counter()
+        at.run()
+        latencies.append((time.perf_counter() - start) * 1000)
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+
+    at = AppTest.from_file(app, default_timeout=120)
+    run(at)
+    yield
+
+    username, password = f"load{n}", f"secret-{n}"
+
+    at.radio[0].set_value("Sign Up")
+    run(at)
+    yield
+    at.text_input(key="signup_user").input(username)
+    at.text_input(key="signup_pass").input(password)
+    at.text_input(key="confirm_pass").input(password)
+    at.button[0].click()
+    run(at)
+    yield
+
+    at.radio[0].set_value("Login")
+    run(at)
+    yield
+    at.text_input(key="login_user").input(username)
+    at.text_input(key="login_pass").input(password)
+    at.button[0].click()
+    run(at)
+    yield
+    run(at)
+    yield
+    if not at.session_state["logged_in"]:
+        raise RuntimeError(f"session {n} could not log in")
+
+    for section in at.sidebar.radio[0].options:
+        at.sidebar.radio[0].set_value(section)
+        run(at)
+        yield
+
+    at.sidebar.radio[0].set_value("Feedback")
+    run(at)
+    yield
+    at.text_area[0].input(f"Load test feedback from session {n}")
+    next(b for b in at.button if b.label == "Submit Feedback").click()
+    run(at)
+    yield
+
+    at.sidebar.radio[0].set_value("Chatbot")
+    run(at)
+    yield
+    for message in CHAT_MESSAGES:
+        at.chat_input[0].set_value(message)
+        run(at)
+        yield
+
+
+# styles.css and the Home image are deployed next to the app but not kept in
+# the repository; blank stand-ins let the scratch copy render every page
+def seed_assets(workdir):
+    from PIL import Image
+
+    css = os.path.join(workdir, "styles.css")
+    if not os.path.exists(css):
+        with open(css, "w", encoding="utf-8") as f:
+            f.write("\n")
+    image = os.path.join(workdir, "Home Page.png")
+    if not os.path.exists(image):
+        Image.new("RGB", (1200, 600), "white").save(image)
+
+
+def load_test(sessions, bcrypt_rounds):
+    # The app writes users, feedback and logs relative to its working
+    # directory, so run it from a scratch copy of the tree
+    workdir = tempfile.mkdtemp(prefix="gdpbi-load-")
+    shutil.copytree(ROOT, workdir, dirs_exist_ok=True,
+                    ignore=shutil.ignore_patterns(".git", "__pycache__", "*.jsonl", "*.jsonl.*"))
+    seed_assets(workdir)
+    os.environ["GDPBI_BCRYPT_ROUNDS"] = str(bcrypt_rounds)
+    os.chdir(workdir)
+    sys.path.insert(0, workdir)
+
+    latencies, errors = [], []
+    app = os.path.join(workdir, "gdpbi.py")
+    live = {n: simulate(n, app, latencies) for n in range(sessions)}
+    start = time.perf_counter()
+    while live:
+        for n, steps in list(live.items()):
+            try:
+                next(steps)
+            except StopIteration:
+                del live[n]
+            except Exception as exc:
+                errors.append(f"session {n}: {exc}")
+                del live[n]
+    elapsed = time.perf_counter() - start
+
+    from feedback_store import get_feedback_writer
+    get_feedback_writer().close()
+    os.chdir(ROOT)
+    shutil.rmtree(workdir, ignore_errors=True)
+
+    latencies.sort()
+    return {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(0.95 * (len(latencies) - 1))],
+        "p99_ms": latencies[int(0.99 * (len(latencies) - 1))],
+        "reruns_per_s": len(latencies) / elapsed,
+        "peak_rss_mb": peak_rss_mb(),
+    }, errors
+
+
+# Metrics that are worse than the baseline by more than `threshold`
+def regressions(result, baseline, threshold):
+    found = []
+    for key, higher_is_better in COMPARED.items():
+        if key not in baseline:
+            continue
+        old, new = baseline[key], result[key]
+        change = (old - new) / old if higher_is_better else (new - old) / old
+        if change > threshold:
+            found.append(f"{key}: {old:.1f} -> {new:.1f} ({change:+.0%})")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--bcrypt-rounds", type=int, default=4)
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative regression")
+    args = parser.parse_args()
+
+    result, errors = load_test(args.sessions, args.bcrypt_rounds)
+    for key, value in result.items():
+        print(f"{key:>14}: {value:,.1f}" if isinstance(value, float) else f"{key:>14}: {value}")
+    if errors:
+        print("\n".join(errors), file=sys.stderr)
+        sys.exit(1)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("sessions") != result["sessions"]:
+            print("Baseline was recorded with a different session count; not comparing.")
+            return
+        found = regressions(result, baseline, args.threshold)
+        if found:
+            print("Regressions beyond threshold:\n  " + "\n  ".join(found), file=sys.stderr)
+            sys.exit(1)
+        print("No regressions beyond threshold.")
+
+
+if __name__ == "__main__":
+    main()
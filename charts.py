@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Points sent per series; roughly two per horizontal pixel of a wide chart
+MAX_POINTS = 2000
+
+
+# Largest-Triangle-Three-Buckets: keeps the first and last points plus the
+# most visually significant point of each of n_out - 2 equal buckets
+def lttb_indices(x, y, n_out):
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[: n - 1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(y[: n - 1], edges[:-1]) / counts
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - next_x[i]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (next_y[i] - ay))
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return out
+
+
+# Min/max bucketing: the lowest and highest point of n_out // 2 buckets
+def minmax_indices(y, n_out):
+    n = len(y)
+    if n <= n_out or n_out < 2:
+        return np.arange(n)
+    buckets = n_out // 2
+    size = -(-n // buckets)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(buckets, size)
+    valid = ~np.isnan(padded).all(axis=1)
+    offsets = np.arange(buckets)[valid] * size
+    lows = np.nanargmin(padded[valid], axis=1) + offsets
+    highs = np.nanargmax(padded[valid], axis=1) + offsets
+    return np.unique(np.concatenate([lows, highs, [0, n - 1]]))
+
+
+def _to_frame(data):
+    if isinstance(data, pd.DataFrame):
+        return data
+    if isinstance(data, pd.Series):
+        return data.to_frame()
+    if hasattr(data, "to_pandas"):
+        # Arrow tables; categorical columns stay dictionary-encoded
+        return data.to_pandas(self_destruct=True, split_blocks=True)
+    return pd.DataFrame(data)
+
+
+# x positions as floats; labels that are not numbers or times (city names,
+# categories) are spaced evenly by row
+def _numeric(values):
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64) or np.issubdtype(values.dtype, np.timedelta64):
+        return values.astype("int64").astype(np.float64)
+    if not (np.issubdtype(values.dtype, np.number) or np.issubdtype(values.dtype, np.bool_)):
+        return np.arange(len(values), dtype=np.float64)
+    return values.astype(np.float64)
+
+
+# Reduces each numeric series to at most max_points // n_series points along
+# `x` (a column, or the index when None); the union of kept rows is returned
+def downsample(data, x=None, max_points=MAX_POINTS, method="lttb"):
+    frame = _to_frame(data)
+    columns = [c for c in frame.columns if c != x and pd.api.types.is_numeric_dtype(frame[c])]
+    if len(frame) <= max_points or not columns:
+        return frame
+    xs = _numeric(frame[x] if x is not None else frame.index)
+    budget = max(3, max_points // len(columns))
+    keep = []
+    for column in columns:
+        ys = frame[column].to_numpy(np.float64, na_value=np.nan)
+        if method == "minmax":
+            keep.append(minmax_indices(ys, budget))
+        else:
+            keep.append(lttb_indices(xs, np.nan_to_num(ys), budget))
+    return frame.iloc[np.unique(np.concatenate(keep))]
+
+
+# Drop-in for st.line_chart that accepts DataFrames, Series or Arrow tables
+# and bounds the payload regardless of how many rows back the chart
+def line_chart(data, x=None, max_points=MAX_POINTS, method="lttb", **kwargs):
+    st.line_chart(downsample(data, x, max_points, method), x=x, **kwargs)
+
+
+# History as a solid line, the projection dashed with its prediction band
+# shaded; `forecast` has Forecast, Lower and Upper columns indexed like
+# `history`
+def forecast_chart(history, forecast, x_label="Year", y_label="GDP (in Trillions)"):
+    import altair as alt
+
+    x = history.index.name or "x"
+    last = history.iloc[-1:]
+    # Start the projection at the last observation so the lines join up
+    projected = pd.concat([
+        pd.DataFrame({"Forecast": last.values, "Lower": last.values, "Upper": last.values}, index=last.index),
+        forecast,
+    ]).rename_axis(x).reset_index()
+    observed = history.rename("value").rename_axis(x).reset_index()
+
+    x_axis = alt.X(f"{x}:O", title=x_label)
+    band = alt.Chart(projected).mark_area(opacity=0.25).encode(
+        x=x_axis, y=alt.Y("Lower:Q", title=y_label), y2="Upper:Q",
+        tooltip=[x, alt.Tooltip("Lower:Q", format=".2f"), alt.Tooltip("Upper:Q", format=".2f")],
+    )
+    trend = alt.Chart(projected).mark_line(strokeDash=[6, 4], point=True).encode(
+        x=x_axis, y="Forecast:Q", tooltip=[x, alt.Tooltip("Forecast:Q", format=".2f")],
+    )
+    actual = alt.Chart(observed).mark_line(point=True).encode(
+        x=x_axis, y="value:Q", tooltip=[x, alt.Tooltip("value:Q", title=y_label, format=".2f")],
+    )
+    st.altair_chart(band + trend + actual)
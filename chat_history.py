@@ -0,0 +1,73 @@
+import json
+import os
+import uuid
+from collections import deque
+
+from sessions import session_data
+
+MAX_MESSAGES = 200  # kept in session memory
+PAGE_SIZE = 20  # rendered per page
+# Messages pushed out of memory are appended here when set; otherwise dropped
+SPILL_DIR = os.environ.get("GDPBI_CHAT_SPILL_DIR")
+
+
+# Bounded chat transcript for one session
+# The newest MAX_MESSAGES live in a ring buffer. Older ones are spilled to a
+# per-session JSONL file (only byte offsets stay in memory) so they can still
+# be paged back in.
+class ChatHistory:
+    def __init__(self, max_messages=MAX_MESSAGES, spill_path=None):
+        self.recent = deque()
+        self.max_messages = max_messages
+        self.spill_path = spill_path
+        self._spill_offsets = []
+
+    def __len__(self):
+        return len(self._spill_offsets) + len(self.recent)
+
+    def append(self, role, content):
+        self.recent.append({"role": role, "content": content})
+        while len(self.recent) > self.max_messages:
+            self._spill(self.recent.popleft())
+
+    def _spill(self, message):
+        if not self.spill_path:
+            return
+        with open(self.spill_path, "ab") as f:
+            self._spill_offsets.append(f.tell())
+            f.write(json.dumps(message, ensure_ascii=False).encode() + b"\n")
+
+    def _read_spilled(self, start):
+        with open(self.spill_path, "rb") as f:
+            f.seek(self._spill_offsets[start])
+            return [json.loads(line) for line in f.read().splitlines()]
+
+    # The newest `count` messages, oldest first
+    def window(self, count):
+        recent = list(self.recent)[-count:] if count else []
+        missing = count - len(recent)
+        if missing > 0 and self._spill_offsets:
+            start = max(0, len(self._spill_offsets) - missing)
+            return self._read_spilled(start) + recent
+        return recent
+
+    def clear(self):
+        self.recent.clear()
+        self._spill_offsets = []
+        if self.spill_path and os.path.exists(self.spill_path):
+            os.remove(self.spill_path)
+
+    # Called when the owning session is evicted
+    close = clear
+
+
+# Stored with the server-side session so it counts towards its memory cap
+def get_chat_history():
+    data = session_data()
+    if "messages" not in data:
+        spill_path = None
+        if SPILL_DIR:
+            os.makedirs(SPILL_DIR, exist_ok=True)
+            spill_path = os.path.join(SPILL_DIR, f"{uuid.uuid4().hex}.jsonl")
+        data["messages"] = ChatHistory(spill_path=spill_path)
+    return data["messages"]
@@ -0,0 +1,279 @@
+import hashlib
+import io
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from dataset import COLUMNS, DATA_FILE, DTYPES, dataset_version, load_dataset
+from profiler import timed
+
+MEASURES = ("gdp", "employment", "labour_force")
+# National aggregates the Insights page reads; see derived_metrics()
+DERIVED = ("gdp_by_year", "employment_rate_by_year", "sector_share", "sector_growth")
+AXES = ("city", "sector", "year")
+# Written by refresh.py; CURRENT names the snapshot readers should serve
+SNAPSHOT_DIR = os.environ.get("GDPBI_SNAPSHOT_DIR", "snapshots")
+CURRENT = "CURRENT"
+
+
+# Dense city x sector x year roll-up of the fact table
+# Each measure is a float64 array indexed [city, sector, year]; filtering is an
+# index slice followed by a sum over the axes that are not being plotted.
+class Cube:
+    def __init__(self, cities, states, sectors, years, values):
+        self.cities = np.asarray(cities, dtype=object)
+        self.states = np.asarray(states, dtype=object)
+        self.sectors = np.asarray(sectors, dtype=object)
+        self.years = np.asarray(years, dtype=np.int64)
+        self.values = values
+        # Arrays named in DERIVED; memory-mapped from a snapshot, or computed
+        # on first use by insights()
+        self.derived = None
+        # Snapshot name and (data file, dataset_version) it was built from
+        self.snapshot = None
+        self.source = None
+
+    @classmethod
+    def from_frame(cls, df):
+        cities, city_idx = _sorted_codes(df["city"])
+        sectors, sector_idx = _sorted_codes(df["sector"])
+        years = np.unique(df["year"].to_numpy())
+        year_idx = np.searchsorted(years, df["year"].to_numpy())
+        states = df.groupby("city", observed=False)["state"].first().reindex(cities).astype(object).to_numpy()
+
+        flat = (city_idx * len(sectors) + sector_idx) * len(years) + year_idx
+        shape = (len(cities), len(sectors), len(years))
+        values = {
+            m: np.bincount(flat, weights=df[m].to_numpy(np.float64), minlength=np.prod(shape)).reshape(shape)
+            for m in MEASURES
+        }
+        return cls(cities, states, sectors, years, values)
+
+    # Returns a new cube with the rows of `df` added; the current cube is left
+    # untouched for readers still holding it
+    def extended(self, df):
+        return self.merged(Cube.from_frame(df))
+
+    # Sum of two cubes over the union of their labels
+    def merged(self, other):
+        cities = np.union1d(self.cities, other.cities)
+        sectors = np.union1d(self.sectors, other.sectors)
+        years = np.union1d(self.years, other.years)
+        values = {m: np.zeros((len(cities), len(sectors), len(years))) for m in MEASURES}
+        for cube in (self, other):
+            idx = np.ix_(
+                np.searchsorted(cities, cube.cities),
+                np.searchsorted(sectors, cube.sectors),
+                np.searchsorted(years, cube.years),
+            )
+            for m in MEASURES:
+                values[m][idx] += cube.values[m]
+        states = {}
+        for cube in (other, self):
+            states.update((c, s) for c, s in zip(cube.cities, cube.states) if isinstance(s, str))
+        return Cube(cities, [states.get(c) for c in cities], sectors, years, values)
+
+    def insights(self):
+        if self.derived is None:
+            self.derived = derived_metrics(self.values)
+        return self.derived
+
+    def _selection(self, cities=None, sectors=None, years=None):
+        c = np.flatnonzero(np.isin(self.cities, cities)) if cities else np.arange(len(self.cities))
+        s = np.flatnonzero(np.isin(self.sectors, sectors)) if sectors else np.arange(len(self.sectors))
+        if years:
+            y = np.arange(np.searchsorted(self.years, years[0]), np.searchsorted(self.years, years[1], side="right"))
+        else:
+            y = np.arange(len(self.years))
+        return c, s, y
+
+    # Sum of `measure` over the selection, keeping the axes named in `by`
+    # (any of "city", "sector", "year"); `years` is an inclusive (start, end)
+    def rollup(self, measure, by=(), cities=None, sectors=None, years=None):
+        c, s, y = self._selection(cities, sectors, years)
+        block = self.values[measure][np.ix_(c, s, y)]
+        drop = tuple(i for i, axis in enumerate(AXES) if axis not in by)
+        return block.sum(axis=drop)
+
+    # Roll-up as a frame: `index` axis down the rows, optional `columns` axis across
+    def table(self, measure, index, columns=None, cities=None, sectors=None, years=None):
+        c, s, y = self._selection(cities, sectors, years)
+        labels = {"city": self.cities[c], "sector": self.sectors[s], "year": self.years[y]}
+        by = (index,) if columns is None else (index, columns)
+        data = self.rollup(measure, by, cities, sectors, years)
+        if columns is None:
+            return pd.Series(data, index=pd.Index(labels[index], name=index), name=measure)
+        if AXES.index(index) > AXES.index(columns):
+            data = data.T
+        return pd.DataFrame(data, index=pd.Index(labels[index], name=index), columns=labels[columns])
+
+
+# Category labels in sorted order with each row's position among them
+def _sorted_codes(column):
+    categories = np.asarray(column.cat.categories, dtype=object)
+    order = np.argsort(categories)
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    return categories[order], rank[column.cat.codes.to_numpy()]
+
+
+# Per year: total GDP and employment rate (%); per sector x year: share of
+# total GDP (%) and year-over-year growth (%)
+def derived_metrics(values):
+    gdp = np.asarray(values["gdp"], dtype=np.float64)
+    sector_gdp = gdp.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = (np.asarray(values["employment"]).sum(axis=(0, 1))
+                / np.asarray(values["labour_force"]).sum(axis=(0, 1)) * 100)
+        share = sector_gdp / sector_gdp.sum(axis=0) * 100
+        growth = np.full_like(sector_gdp, np.nan)
+        growth[:, 1:] = (sector_gdp[:, 1:] / sector_gdp[:, :-1] - 1) * 100
+    return {"gdp_by_year": sector_gdp.sum(axis=0), "employment_rate_by_year": rate,
+            "sector_share": share, "sector_growth": growth}
+
+
+# Total GDP per year
+def gdp_by_year(cube):
+    return pd.Series(cube.insights()["gdp_by_year"], index=pd.Index(cube.years, name="year"), name="gdp")
+
+
+# Employed share of the labour force per year, in percent
+def employment_rate_by_year(cube):
+    return pd.Series(cube.insights()["employment_rate_by_year"], index=pd.Index(cube.years, name="year"))
+
+
+# Share of GDP and year-over-year growth per sector for the latest year
+def sector_summary(cube):
+    derived = cube.insights()
+    summary = pd.DataFrame({
+        "Sector": cube.sectors.astype(str),
+        "Contribution to GDP (%)": np.round(derived["sector_share"][:, -1], 1),
+        "Growth Rate (%)": np.round(derived["sector_growth"][:, -1], 1),
+    })
+    return summary.sort_values("Contribution to GDP (%)", ascending=False, ignore_index=True)
+
+
+def current_snapshot(root=SNAPSHOT_DIR):
+    try:
+        with open(os.path.join(root, CURRENT), encoding="utf-8") as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+# Cube over a snapshot's arrays, memory-mapped read-only (no copy is made)
+def load_snapshot(name, root=SNAPSHOT_DIR):
+    path = os.path.join(root, name)
+    with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+    values = {m: np.load(os.path.join(path, f"{m}.npy"), mmap_mode="r") for m in MEASURES}
+    cube = Cube(meta["cities"], meta["states"], meta["sectors"], meta["years"], values)
+    cube.derived = {m: np.load(os.path.join(path, f"{m}.npy"), mmap_mode="r") for m in DERIVED}
+    cube.snapshot = name
+    if "source" in meta:
+        cube.source = (meta["source"]["path"], tuple(meta["source"]["version"]))
+    return cube
+
+
+# Old snapshots stay mapped for sessions still holding them
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _snapshot_cube(name, root):
+    return load_snapshot(name, root)
+
+
+# The published snapshot, if any. It is served until refresh.py publishes the
+# next one, also while the data file has moved on; see is_stale().
+def active_snapshot(path=DATA_FILE):
+    name = current_snapshot()
+    return _snapshot_cube(name, SNAPSHOT_DIR) if name else None
+
+
+# True for a snapshot built from an older version of the data file than the
+# one on disk now
+def is_stale(cube, path=DATA_FILE):
+    return cube.snapshot is not None and cube.source != (os.path.realpath(path), dataset_version(path))
+
+
+@st.cache_resource
+def _cube_holder():
+    return {"version": None, "cube": None, "size": 0, "digest": None, "lock": threading.Lock()}
+
+
+def _hash_bytes(digest, f, count):
+    while count > 0:
+        chunk = f.read(min(1 << 20, count))
+        if not chunk:
+            break
+        digest.update(chunk)
+        count -= len(chunk)
+
+
+# One pass over the first `end` bytes of a file. Returns the SHA-1 of those
+# bytes, the bytes after `size` if the first `size` still hash to `expected`
+# (None otherwise), and whether the last byte is a newline.
+def _scan(path, size, end, expected):
+    digest = hashlib.sha1()
+    tail = None
+    with open(path, "rb") as f:
+        _hash_bytes(digest, f, size)
+        if expected is not None and f.tell() == size and digest.hexdigest() == expected:
+            tail = f.read(end - size)
+            digest.update(tail)
+        else:
+            _hash_bytes(digest, f, end - size)
+        f.seek(max(end - 1, 0))
+        last = f.read(1) if end else b""
+    return digest.hexdigest(), tail, last == b"\n"
+
+
+# Rows in `data`, a run of complete lines from the CSV at `path`
+def _parse_lines(path, data):
+    with open(path, "rb") as f:
+        header = f.readline()
+    return pd.read_csv(io.BytesIO(header + data), usecols=COLUMNS, dtype=DTYPES)
+
+
+# Identifies the cube get_cube() serves, for caches derived from it
+def cube_version(path=DATA_FILE):
+    snapshot = active_snapshot(path)
+    return ("snapshot", snapshot.snapshot) if snapshot else ("data", *dataset_version(path))
+
+
+# Process-wide cube. A snapshot published by refresh.py takes precedence and
+# is switched to as soon as CURRENT changes. Otherwise the cube follows the
+# dataset version: when a CSV data file has only had rows appended (its
+# previous contents are an unchanged prefix), only the appended bytes are
+# parsed and merged in; any other change rebuilds the cube from scratch.
+# Checking the prefix still reads the file once, but hashing is far cheaper
+# than parsing it.
+def get_cube(path=DATA_FILE):
+    snapshot = active_snapshot(path)
+    if snapshot is not None:
+        return snapshot
+    holder = _cube_holder()
+    version = dataset_version(path)
+    if holder["version"] == version:
+        return holder["cube"]
+    with holder["lock"], timed("data:cube"):
+        if holder["version"] != version:
+            if path.endswith(".parquet"):
+                cube, digest, whole_lines = Cube.from_frame(load_dataset(path=path)), None, False
+            else:
+                cube = holder["cube"]
+                expected = holder["digest"] if cube is not None else None
+                digest, tail, whole_lines = _scan(path, holder["size"], version[1], expected)
+                if tail is None:
+                    cube = Cube.from_frame(load_dataset(path=path))
+                elif tail:
+                    new_rows = _parse_lines(path, tail)
+                    if len(new_rows):
+                        cube = cube.extended(new_rows)
+            # Appends can only be trusted after a complete last line, and only
+            # if the file did not change again while it was being read
+            appendable = whole_lines and dataset_version(path) == version
+            holder.update(cube=cube, version=version, size=version[1], digest=digest if appendable else None)
+        return holder["cube"]
@@ -0,0 +1,205 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from cube import cube_version, get_cube
+from intents import tokenize
+
+# Structured form of a data question
+# measure: gdp | employment | employment_rate | unemployment_rate | growth | share
+# group: None for a single figure, else "city" | "sector" | "state" | "year"
+Query = namedtuple("Query", "measure group cities sectors year top ascending")
+
+# Checked in order, first hit wins
+MEASURE_PHRASES = [
+    (("unemployment",), "unemployment_rate"),
+    (("employment", "rate"), "employment_rate"),
+    (("growth",), "growth"),
+    (("grew",), "growth"),
+    (("share",), "share"),
+    (("contribution",), "share"),
+    (("employment",), "employment"),
+    (("jobs",), "employment"),
+    (("employed",), "employment"),
+    (("gdp",), "gdp"),
+    (("output",), "gdp"),
+]
+GROUP_WORDS = {
+    "cities": "city", "city": "city",
+    "sectors": "sector", "sector": "sector",
+    "states": "state", "state": "state",
+    "year": "year", "years": "year", "trend": "year", "yearly": "year",
+}
+YEAR_RE = re.compile(r"^(19|20)\d\d$")
+PLURALS = {"city": "cities", "sector": "sectors", "state": "states"}
+CACHE_SIZE = 1024
+
+
+def _ngrams(tokens, n):
+    return (tuple(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+
+
+def _find_labels(tokens, labels):
+    lookup = {tuple(tokenize(label)): label for label in labels}
+    longest = max((len(key) for key in lookup), default=1)
+    found = []
+    for n in range(1, longest + 1):
+        for gram in _ngrams(tokens, n):
+            if gram in lookup and lookup[gram] not in found:
+                found.append(lookup[gram])
+    return tuple(found)
+
+
+# Returns a Query, or None when the message is not a question about the data
+def parse_question(question, cube):
+    tokens = tokenize(question)
+    grams = set(_ngrams(tokens, 1)) | set(_ngrams(tokens, 2))
+    measure = next((m for phrase, m in MEASURE_PHRASES if phrase in grams), None)
+    if measure is None:
+        return None
+
+    cities = _find_labels(tokens, cube.cities)
+    sectors = _find_labels(tokens, cube.sectors)
+    years = [int(t) for t in tokens if YEAR_RE.match(t)]
+    year = years[0] if years else None
+
+    top = None
+    for i, token in enumerate(tokens):
+        if token in ("top", "bottom", "lowest", "highest") and i + 1 < len(tokens) and tokens[i + 1].isdigit():
+            top = int(tokens[i + 1])
+    ascending = any(t in ("bottom", "lowest", "least", "worst") for t in tokens)
+
+    group = None
+    for token in tokens:
+        if token in GROUP_WORDS:
+            group = GROUP_WORDS[token]
+            break
+    if group is None and top is not None:
+        group = "city"
+    if group is None and measure == "share" and cities and not sectors:
+        group = "sector"
+    if group in ("city", "state") and len(cities) == 1 and measure == "share" and not sectors:
+        group = "sector"
+
+    if not (cities or sectors or year or group or top):
+        return None
+    if group is not None and top is None and group != "year":
+        top = 10
+    return Query(measure, group, cities, sectors, year, top, ascending)
+
+
+def _by(cube, measure, group, cities, sectors, year):
+    years = (year, year) if year is not None else None
+    if group is None:
+        return float(cube.rollup(measure, (), cities, sectors, years))
+    if group == "state":
+        by_city = cube.table(measure, "city", cities=cities, sectors=sectors, years=years)
+        states = pd.Series(cube.states, index=cube.cities).reindex(by_city.index)
+        return by_city.groupby(states.values).sum()
+    return cube.table(measure, group, cities=cities, sectors=sectors, years=years)
+
+
+def _evaluate(cube, query):
+    q = query
+    year = q.year if q.year is not None else (None if q.group == "year" else int(cube.years[-1]))
+    if q.measure in ("gdp", "employment"):
+        return _by(cube, q.measure, q.group, q.cities, q.sectors, year), year
+    if q.measure in ("employment_rate", "unemployment_rate"):
+        employed = _by(cube, "employment", q.group, q.cities, q.sectors, year)
+        labour = _by(cube, "labour_force", q.group, q.cities, q.sectors, year)
+        rate = employed / labour * 100
+        return (rate if q.measure == "employment_rate" else 100 - rate), year
+    if q.measure == "share":
+        part = _by(cube, "gdp", q.group, q.cities, q.sectors, year)
+        if q.group in ("city", "state") and not q.sectors:
+            # Each city's or state's share of the national total
+            whole = _by(cube, "gdp", None, (), (), year)
+        elif q.group == "year" and not q.sectors:
+            whole = _by(cube, "gdp", "year", (), (), year)
+        else:
+            # The sectors' share of the cities' (or each city's) total
+            whole_group = q.group if q.group != "sector" else None
+            whole = _by(cube, "gdp", whole_group, q.cities, (), year)
+        return part / whole * 100, year
+    # growth: year-over-year change of GDP
+    if q.group == "year":
+        series = _by(cube, "gdp", "year", q.cities, q.sectors, None)
+        return (series.pct_change() * 100).dropna(), None
+    if year is None or year - 1 < cube.years[0]:
+        return None, year
+    current = _by(cube, "gdp", q.group, q.cities, q.sectors, year)
+    previous = _by(cube, "gdp", q.group, q.cities, q.sectors, year - 1)
+    return (current / previous - 1) * 100, year
+
+
+LABELS = {
+    "gdp": "GDP",
+    "employment": "employment",
+    "employment_rate": "employment rate",
+    "unemployment_rate": "unemployment rate",
+    "growth": "GDP growth",
+    "share": "share of GDP",
+}
+
+
+def _format(measure, value):
+    if measure == "gdp":
+        return f"{value:,.2f} trillion"
+    if measure == "employment":
+        return f"{value:,.1f} thousand people"
+    return f"{value:.1f}%"
+
+
+def _describe(query, year):
+    parts = [LABELS[query.measure]]
+    scope = list(query.sectors) + list(query.cities)
+    if scope:
+        parts.append("for " + ", ".join(scope))
+    if year is not None:
+        parts.append(f"in {year}")
+    return " ".join(parts)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _run(query, version):
+    cube = get_cube()
+    if query.year is not None and query.year not in cube.years:
+        return (f"No data for {_describe(query, query.year)}. "
+                f"The data covers {cube.years[0]} to {cube.years[-1]}.")
+    if query.measure == "share" and not (query.cities or query.sectors) and query.group in (None, "year"):
+        return "Name a city or sector to see its share of GDP."
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result, year = _evaluate(cube, query)
+    if result is None:
+        return f"There is no earlier year to compare {year} against."
+    title = _describe(query, year)
+    if not isinstance(result, pd.Series):
+        if not np.isfinite(result):
+            return f"No data for {title}."
+        return f"The {title} is **{_format(query.measure, result)}**."
+    result = result[np.isfinite(result)]
+    if result.empty:
+        return f"No data for {title}."
+    if query.group == "year" and query.top is None:
+        result = result.sort_index()
+        lines = [f"{title[0].upper()}{title[1:]} by year:"]
+        lines += [f"- {label}: {_format(query.measure, value)}" for label, value in result.items()]
+    else:
+        result = result.sort_values(ascending=query.ascending).head(query.top)
+        which = "Bottom" if query.ascending else "Top"
+        lines = [f"{which} {len(result)} {PLURALS.get(query.group, query.group)} by {title}:"]
+        lines += [f"{i}. {label}: {_format(query.measure, value)}" for i, (label, value) in enumerate(result.items(), 1)]
+    return "\n".join(lines)
+
+
+# Answer to a data question, or None if the message is not one
+# Answers are LRU-cached per parsed query and version of the served cube.
+def answer_question(question):
+    cube = get_cube()
+    query = parse_question(question, cube)
+    if query is None:
+        return None
+    return _run(query, cube_version())
@@ -0,0 +1,45 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+from profiler import timed
+
+# City x sector x year fact table
+# gdp is in trillions, employment and labour_force in thousands of people.
+DATA_FILE = os.environ.get("GDPBI_DATA", os.path.join("data", "gdp_city_sector.csv"))
+COLUMNS = ["city", "state", "sector", "year", "gdp", "employment", "labour_force"]
+CATEGORICAL = ["city", "state", "sector"]
+DTYPES = {
+    "city": "category",
+    "state": "category",
+    "sector": "category",
+    "year": "int16",
+    "gdp": "float32",
+    "employment": "float32",
+    "labour_force": "float32",
+}
+
+
+def dataset_version(path=DATA_FILE):
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# Cached as a resource rather than with st.cache_data so reruns share one
+# frame instead of unpickling a copy each time; callers must not mutate it.
+@st.cache_resource(show_spinner="Loading dataset...", max_entries=4)
+def _load(path, version, columns):
+    columns = list(columns)
+    if path.endswith(".parquet"):
+        df = pd.read_parquet(path, columns=columns)
+        df = df.astype({c: DTYPES[c] for c in columns})
+    else:
+        df = pd.read_csv(path, usecols=columns, dtype={c: DTYPES[c] for c in columns})
+    return df
+
+
+# Loads only the requested columns; a new file version invalidates the cache
+def load_dataset(columns=None, path=DATA_FILE):
+    with timed("data:load"):
+        return _load(path, dataset_version(path), tuple(columns or COLUMNS))
@@ -0,0 +1,205 @@
+import os
+import secrets
+import shutil
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse
+from starlette.routing import Route
+
+from dataset import COLUMNS, DATA_FILE
+
+# Exports of the fact table. Rows are read, filtered and encoded one chunk at
+# a time into a file on disk, which the server then streams to the browser,
+# so memory use stays at about one chunk however many rows the export has.
+CHUNK_ROWS = 100_000
+EXPORT_DIR = os.path.join("static", "exports")
+EXPORT_TTL = 3600  # seconds an export stays downloadable
+# Served by serve.py through export_routes(). Without it, exports fall back to
+# Streamlit's /app/static route, which refuses files over STATIC_MAX_BYTES.
+EXPORT_ROUTE = "/exports"
+STATIC_MAX_BYTES = 200 * 1024 * 1024
+EXCEL_MAX_ROWS = 1_048_575  # one sheet, less the header row
+
+# Fixed schema so every chunk becomes a row group of the same Parquet file
+SCHEMA = pa.schema([
+    ("city", pa.string()),
+    ("state", pa.string()),
+    ("sector", pa.string()),
+    ("year", pa.int16()),
+    ("gdp", pa.float32()),
+    ("employment", pa.float32()),
+    ("labour_force", pa.float32()),
+])
+CSV_DTYPES = {field.name: field.type.to_pandas_dtype() for field in SCHEMA}
+CSV_DTYPES.update(city="str", state="str", sector="str")
+
+
+# Yields the rows matching the filters as DataFrames of at most chunk_rows
+# rows; `years` is an inclusive (first, last) range
+def iter_rows(cities=None, sectors=None, years=None, path=DATA_FILE, chunk_rows=CHUNK_ROWS):
+    if path.endswith(".parquet"):
+        batches = pq.ParquetFile(path).iter_batches(batch_size=chunk_rows, columns=COLUMNS)
+        chunks = (batch.to_pandas() for batch in batches)
+    else:
+        chunks = pd.read_csv(path, usecols=COLUMNS, dtype=CSV_DTYPES, chunksize=chunk_rows)
+    for chunk in chunks:
+        mask = pd.Series(True, index=chunk.index)
+        if cities:
+            mask &= chunk["city"].isin(cities)
+        if sectors:
+            mask &= chunk["sector"].isin(sectors)
+        if years:
+            mask &= chunk["year"].between(*years)
+        chunk = chunk.loc[mask, COLUMNS]
+        if len(chunk):
+            yield chunk
+
+
+def write_csv(chunks, out):
+    header = True
+    for chunk in chunks:
+        out.write(chunk.to_csv(index=False, header=header).encode("utf-8"))
+        header = False
+    if header:
+        out.write((",".join(COLUMNS) + "\n").encode("utf-8"))
+
+
+def write_parquet(chunks, out):
+    with pq.ParquetWriter(out, SCHEMA, compression="zstd") as writer:
+        for chunk in chunks:
+            writer.write_table(pa.Table.from_pandas(chunk, schema=SCHEMA, preserve_index=False))
+
+
+# openpyxl's write-only mode streams rows to disk instead of keeping cells
+def write_excel(chunks, out):
+    from openpyxl import Workbook
+
+    book = Workbook(write_only=True)
+    sheet = book.create_sheet("GDP")
+    sheet.append(COLUMNS)
+    rows = 0
+    for chunk in chunks:
+        rows += len(chunk)
+        if rows > EXCEL_MAX_ROWS:
+            raise ValueError(f"Excel sheets hold at most {EXCEL_MAX_ROWS:,} rows; export as Parquet instead")
+        for row in chunk.astype(object).where(chunk.notna(), None).itertuples(index=False):
+            sheet.append(row)
+    book.save(out)
+
+
+def _excel_available():
+    try:
+        import openpyxl  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# Label -> (writer, file extension)
+FORMATS = {
+    "CSV": (write_csv, "csv"),
+    "Parquet": (write_parquet, "parquet"),
+}
+if _excel_available():
+    FORMATS["Excel"] = (write_excel, "xlsx")
+
+
+# Writes the matching rows to the binary file `out` in format `fmt`
+def export(fmt, out, cities=None, sectors=None, years=None, path=DATA_FILE):
+    FORMATS[fmt][0](iter_rows(cities, sectors, years, path), out)
+
+
+def _prune_exports(now):
+    if not os.path.isdir(EXPORT_DIR):
+        return
+    for name in os.listdir(EXPORT_DIR):
+        folder = os.path.join(EXPORT_DIR, name)
+        if now - os.path.getmtime(folder) > EXPORT_TTL:
+            shutil.rmtree(folder, ignore_errors=True)
+
+
+# Writes an export into its own directory, named by an unguessable token, and
+# returns the path of the finished file. Exports older than EXPORT_TTL are
+# removed first.
+def publish_export(fmt, file_name, cities=None, sectors=None, years=None, path=DATA_FILE):
+    _prune_exports(time.time())
+    token = secrets.token_urlsafe(16)
+    folder = os.path.join(EXPORT_DIR, token)
+    os.makedirs(folder)
+    tmp = os.path.join(folder, f".{file_name}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            export(fmt, f, cities, sectors, years, path)
+        os.replace(tmp, os.path.join(folder, file_name))
+    except BaseException:
+        shutil.rmtree(folder, ignore_errors=True)
+        raise
+    return os.path.join(folder, file_name)
+
+
+_routed = False
+
+
+# Starlette route streaming finished exports from disk, whatever their size
+def export_routes():
+    global _routed
+    _routed = True
+    return [Route(EXPORT_ROUTE + "/{token}/{file_name}", _serve_export, methods=["GET"])]
+
+
+async def _serve_export(request):
+    token, file_name = request.path_params["token"], request.path_params["file_name"]
+    if token.startswith(".") or file_name.startswith("."):
+        raise HTTPException(status_code=404)
+    path = os.path.join(EXPORT_DIR, token, file_name)
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404)
+    return FileResponse(path, filename=file_name)
+
+
+# URL the browser downloads `path` from, or None if no route can serve it
+def export_url(path):
+    token, file_name = path.split(os.sep)[-2:]
+    if _routed:
+        return f"{EXPORT_ROUTE}/{token}/{file_name}"
+    if os.path.getsize(path) > STATIC_MAX_BYTES:
+        return None
+    base = st.get_option("server.baseUrlPath").strip("/")
+    return f"{'/' + base if base else ''}/app/static/exports/{token}/{file_name}"
+
+
+# Format picker and export button for the rows behind the current view. The
+# file is only written when asked for, and the link is dropped again as soon
+# as the filters or the format change.
+def download_button(key, cities=None, sectors=None, years=None, path=DATA_FILE):
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        fmt = st.selectbox("Format", list(FORMATS), index=1, key=f"{key}_format",
+                           help="Parquet is compressed and best for large exports.")
+    file_name = f"gdp_{key}.{FORMATS[fmt][1]}"
+    request = (fmt, tuple(cities or ()), tuple(sectors or ()), tuple(years or ()))
+    with col2:
+        if st.button(f"Export {fmt}", key=f"{key}_export_button"):
+            st.session_state.pop(f"{key}_export", None)
+            try:
+                with st.spinner("Writing export..."):
+                    written = publish_export(fmt, file_name, cities, sectors, years, path)
+            except ValueError as exc:
+                st.error(str(exc))
+            else:
+                url = export_url(written)
+                if url is None:
+                    shutil.rmtree(os.path.dirname(written), ignore_errors=True)
+                    st.error(f"This export is larger than {STATIC_MAX_BYTES // 2**20} MB, the most this "
+                             "server can send. Narrow the filters, or start the app with serve.py.")
+                else:
+                    st.session_state[f"{key}_export"] = (request, url)
+        ready = st.session_state.get(f"{key}_export")
+        if ready and ready[0] == request:
+            st.markdown(f'<a href="{ready[1]}" download="{file_name}">⬇️ Download {file_name}</a>',
+                        unsafe_allow_html=True)
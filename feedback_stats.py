@@ -0,0 +1,128 @@
+import json
+import os
+import threading
+import time
+from collections import Counter
+
+import streamlit as st
+
+from feedback_store import FEEDBACK_FILE
+
+READ_CHUNK = 8 * 1024 * 1024
+CATEGORIES = ["General Feedback", "Data Accuracy", "Dashboard Design", "Feature Suggestions", "Bugs/Issues", "Other"]
+
+
+# Running aggregates over the feedback log
+# refresh() only parses bytes appended since the last call. The read position
+# is tracked by (inode, offset) so a rotation by FeedbackWriter is detected and
+# the tail of the rotated file is finished before starting on the new one.
+# Aggregates are checkpointed next to the log so a restart resumes where the
+# previous process stopped instead of rescanning.
+class FeedbackStats:
+    def __init__(self, path=FEEDBACK_FILE, checkpoint=None):
+        self.path = path
+        self.checkpoint = checkpoint or f"{path}.stats.json"
+        self._lock = threading.Lock()
+        self.inode = None
+        self.offset = 0
+        self.total = 0
+        self.satisfaction = Counter()
+        self.categories = Counter()
+        self.daily_count = Counter()
+        self.daily_satisfaction = Counter()
+        self._days = {}
+        self._load_checkpoint()
+
+    def _load_checkpoint(self):
+        try:
+            with open(self.checkpoint, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.inode, self.offset, self.total = state["inode"], state["offset"], state["total"]
+        self.satisfaction = Counter({int(k): v for k, v in state["satisfaction"].items()})
+        self.categories = Counter(state["categories"])
+        self.daily_count = Counter(state["daily_count"])
+        self.daily_satisfaction = Counter(state["daily_satisfaction"])
+
+    def _save_checkpoint(self):
+        state = {
+            "inode": self.inode,
+            "offset": self.offset,
+            "total": self.total,
+            "satisfaction": self.satisfaction,
+            "categories": self.categories,
+            "daily_count": self.daily_count,
+            "daily_satisfaction": self.daily_satisfaction,
+        }
+        tmp = f"{self.checkpoint}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.checkpoint)
+
+    # Local calendar day of a timestamp, memoised per hour
+    def _day(self, timestamp):
+        hour = int(timestamp // 3600)
+        day = self._days.get(hour)
+        if day is None:
+            day = self._days[hour] = time.strftime("%Y-%m-%d", time.localtime(hour * 3600))
+        return day
+
+    def _add(self, record):
+        day = self._day(record.get("timestamp", 0))
+        rating = int(record.get("satisfaction", 0))
+        self.total += 1
+        self.satisfaction[rating] += 1
+        self.categories[record.get("category", "Other")] += 1
+        self.daily_count[day] += 1
+        self.daily_satisfaction[day] += rating
+
+    # Parses complete lines from `offset` onwards; a trailing partial line is
+    # left for the next call
+    def _consume(self, path, offset):
+        with open(path, "rb") as f:
+            f.seek(offset)
+            pending = b""
+            while True:
+                chunk = f.read(READ_CHUNK)
+                if not chunk:
+                    return offset
+                data = pending + chunk
+                end = data.rfind(b"\n") + 1
+                pending = data[end:]
+                for line in data[:end].splitlines():
+                    if line.strip():
+                        try:
+                            self._add(json.loads(line))
+                        except (ValueError, TypeError):
+                            pass
+                offset += end
+
+    def refresh(self):
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                return False
+            if self.inode == stat.st_ino and self.offset == stat.st_size:
+                return False
+            if self.inode is not None and self.inode != stat.st_ino:
+                rotated = f"{self.path}.1"
+                if os.path.exists(rotated) and os.stat(rotated).st_ino == self.inode:
+                    self._consume(rotated, self.offset)
+                self.offset = 0
+            elif stat.st_size < self.offset:
+                self.offset = 0
+            self.inode = stat.st_ino
+            self.offset = self._consume(self.path, self.offset)
+            self._save_checkpoint()
+            return True
+
+    def average_satisfaction(self):
+        return sum(k * v for k, v in self.satisfaction.items()) / self.total if self.total else 0.0
+
+
+# Shared by every admin session; refreshed on each view of the analytics page
+@st.cache_resource
+def get_feedback_stats():
+    return FeedbackStats()
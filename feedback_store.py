@@ -0,0 +1,117 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+import streamlit as st
+
+logger = logging.getLogger("gdpbi.feedback")
+
+FEEDBACK_FILE = os.environ.get("GDPBI_FEEDBACK_FILE", "feedback.jsonl")
+FLUSH_INTERVAL = 0.5  # seconds between batched writes
+MAX_BATCH = 500
+MAX_BYTES = 64 * 1024 * 1024  # rotate once the live file grows past this
+BACKUPS = 5  # feedback.jsonl.1 ... feedback.jsonl.5
+
+
+# Append-only JSONL sink for feedback submissions
+# submit() only enqueues; a background thread writes whatever has queued up
+# every FLUSH_INTERVAL seconds with a single write and fsync per batch. A batch
+# whose write fails is kept and retried first on the next flush; while writes
+# are failing, or once the thread has stopped, submit() raises instead.
+class FeedbackWriter:
+    def __init__(self, path=FEEDBACK_FILE, flush_interval=FLUSH_INTERVAL, max_bytes=MAX_BYTES, backups=BACKUPS):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._write_lock = threading.Lock()
+        self._pending = []  # batch whose last write failed
+        self._error = None  # that failure, until a write succeeds again
+        self._thread = threading.Thread(target=self._run, name="gdpbi-feedback", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, record):
+        if self._stop.is_set() or not self._thread.is_alive():
+            raise RuntimeError("Feedback writer is closed.")
+        if self._error is not None:
+            raise RuntimeError(f"Feedback cannot be saved right now: {self._error}")
+        record = dict(record)
+        record.setdefault("timestamp", time.time())
+        self._queue.put(record)
+
+    def _drain(self):
+        batch = []
+        while len(batch) < MAX_BATCH:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _rotate(self):
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def _write(self, batch):
+        if os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_bytes:
+            self._rotate()
+        data = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in batch)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self._flush_logged()
+        self._flush_logged()
+        if self._pending:
+            logger.error("Dropped %d feedback records that could not be written", len(self._pending))
+
+    def _flush_logged(self):
+        failing = self._error is not None
+        try:
+            self.flush()
+        except OSError:
+            if not failing:
+                logger.exception("Writing feedback to %s failed; retrying", self.path)
+            return
+        if failing:
+            logger.info("Writing feedback to %s works again", self.path)
+
+    # Writes everything queued so far; safe to call from any thread. Raises
+    # OSError if a write fails, keeping that batch to retry on the next call.
+    def flush(self):
+        with self._write_lock:
+            batch = self._pending or self._drain()
+            while batch:
+                try:
+                    self._write(batch)
+                except OSError as exc:
+                    self._pending, self._error = batch, exc
+                    raise
+                self._pending, self._error = [], None
+                batch = self._drain()
+
+    def close(self):
+        if not self._stop.is_set():
+            self._stop.set()
+            self._thread.join()
+
+
+# One writer per server process, shared by every session
+@st.cache_resource
+def get_feedback_writer():
+    return FeedbackWriter()
@@ -0,0 +1,106 @@
+import logging
+import threading
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from cube import cube_version, get_cube
+
+logger = logging.getLogger("gdpbi.forecast")
+
+HORIZON = 3  # years projected past the last observed one
+# Two-sided 95% Student t quantiles for 1..30 degrees of freedom; 1.96 beyond
+T95 = np.array([
+    np.nan, 12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+])
+
+
+# Log-linear trend fitted to every row of `series` (n_series x n_years) at
+# once. Non-positive values are treated as missing; rows with fewer than three
+# observed years get NaN. Returns point forecasts and 95% prediction bounds
+# for the `horizon` years after the last one, each n_series x horizon.
+def fit_log_linear(series, years, horizon=HORIZON):
+    series = np.asarray(series, dtype=np.float64)
+    years = np.asarray(years, dtype=np.float64)
+    w = (series > 0).astype(np.float64)
+    y = np.log(np.where(w > 0, series, 1.0))
+    t = years - years.mean()
+    future = years[-1] + np.arange(1, horizon + 1) - years.mean()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n = w.sum(axis=1)
+        t_mean = (w * t).sum(axis=1) / n
+        y_mean = (w * y).sum(axis=1) / n
+        dt = (t - t_mean[:, None]) * w
+        stt = (dt * dt).sum(axis=1)
+        slope = (dt * (y - y_mean[:, None])).sum(axis=1) / stt
+        intercept = y_mean - slope * t_mean
+        resid = (y - intercept[:, None] - slope[:, None] * t) * w
+        dof = n - 2
+        s2 = (resid * resid).sum(axis=1) / dof
+
+        log_mid = intercept[:, None] + slope[:, None] * future
+        se = np.sqrt(s2[:, None] * (1 + 1 / n[:, None] + (future - t_mean[:, None]) ** 2 / stt[:, None]))
+        q = np.where(dof > 30, 1.96, T95[np.clip(dof, 0, 30).astype(np.int64)])[:, None]
+        lower, mid, upper = np.exp(log_mid - q * se), np.exp(log_mid), np.exp(log_mid + q * se)
+    unfit = (dof < 1)[:, None]
+    return tuple(np.where(unfit, np.nan, a) for a in (mid, lower, upper))
+
+
+# Projections for every city x sector series of a cube, plus the all-cities
+# and all-sectors totals, so any filter combination is a lookup
+class Forecast:
+    def __init__(self, cube, measure="gdp", horizon=HORIZON):
+        values = np.asarray(cube.values[measure], dtype=np.float64)
+        # Totals go in an extra last row/column on the city and sector axes
+        padded = np.zeros((values.shape[0] + 1, values.shape[1] + 1, values.shape[2]))
+        padded[:-1, :-1] = values
+        padded[-1, :-1] = values.sum(axis=0)
+        padded[:-1, -1] = values.sum(axis=1)
+        padded[-1, -1] = values.sum(axis=(0, 1))
+        shape = padded.shape[:2] + (horizon,)
+        fits = fit_log_linear(padded.reshape(-1, padded.shape[2]), cube.years, horizon)
+        self.mid, self.lower, self.upper = (a.reshape(shape) for a in fits)
+        self.cities = {str(c): i for i, c in enumerate(cube.cities)}
+        self.sectors = {str(s): i for i, s in enumerate(cube.sectors)}
+        self.years = int(cube.years[-1]) + np.arange(1, horizon + 1)
+
+    # Forecast, Lower and Upper by year for one city and/or sector; None
+    # means the total over all of them
+    def series(self, city=None, sector=None):
+        i = self.cities[city] if city is not None else -1
+        j = self.sectors[sector] if sector is not None else -1
+        return pd.DataFrame(
+            {"Forecast": self.mid[i, j], "Lower": self.lower[i, j], "Upper": self.upper[i, j]},
+            index=pd.Index(self.years, name="year"),
+        )
+
+
+# Fits a Forecast in a background thread; `result` stays None until `done`
+# is set, and also afterwards if the fit failed
+class Forecaster:
+    def __init__(self, cube):
+        self.result = None
+        self.done = threading.Event()
+        threading.Thread(target=self._run, args=(cube,), name="gdpbi-forecast", daemon=True).start()
+
+    def _run(self, cube):
+        try:
+            self.result = Forecast(cube)
+        except Exception:
+            logger.exception("Forecast fit failed")
+        finally:
+            self.done.set()
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _forecaster(version):
+    return Forecaster(get_cube())
+
+
+# One fit per cube version, shared by every session
+def get_forecaster():
+    return _forecaster(cube_version())
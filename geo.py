@@ -0,0 +1,338 @@
+import hashlib
+import json
+import math
+import os
+import shutil
+
+import numpy as np
+import streamlit as st
+
+from cube import cube_version, get_cube
+
+CITIES_FILE = os.path.join("data", "geo", "cities.geojson")
+# State or district polygons, joined to the dataset on state name; without
+# the file the map shows the city points only. The shipped file holds coarse
+# outlines of the states in the dataset; point GDPBI_GEO_BOUNDARIES at
+# survey-grade boundaries for a detailed map.
+BOUNDARIES_FILE = os.environ.get("GDPBI_GEO_BOUNDARIES", os.path.join("data", "geo", "boundaries.geojson"))
+STATE_KEYS = ("state", "st_nm", "ST_NM", "NAME_1")
+# Tiles are served by Streamlit's static route (server.enableStaticServing)
+STATIC_DIR = "static"
+TILE_DIR = os.path.join(STATIC_DIR, "tiles")
+ZOOMS = range(3, 9)  # deck.gl over-zooms the last level when zoomed in further
+TILE_SIZE = 256
+METRICS = {"gdp": "GDP (in Trillions)", "employment_rate": "Employment Rate (%)"}
+PALETTE = np.array([[239, 243, 255], [189, 215, 231], [107, 174, 214], [49, 130, 189], [8, 81, 156]])
+NO_DATA = [160, 160, 160, 60]
+
+
+# Web Mercator tile coordinates of a point, as floats
+def _tile_xy(lon, lat, zoom):
+    n = 2 ** zoom
+    lat = max(min(lat, 85.0511), -85.0511)
+    x = (lon + 180) / 360 * n
+    y = (1 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2 * n
+    return x, y
+
+
+# Inclusive tile x/y ranges covering a (west, south, east, north) box
+def tile_range(bbox, zoom):
+    west, south, east, north = bbox
+    last = 2 ** zoom - 1
+    x0, y0 = _tile_xy(west, north, zoom)
+    x1, y1 = _tile_xy(east, south, zoom)
+    return (max(0, int(x0)), max(0, int(y0)), min(last, int(x1)), min(last, int(y1)))
+
+
+def tile_bounds(zoom, x, y):
+    n = 2 ** zoom
+
+    def lat(row):
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+
+    return (x / n * 360 - 180, lat(y + 1), (x + 1) / n * 360 - 180, lat(y))
+
+
+# Douglas-Peucker on a closed ring: keeps the points that deviate from the
+# simplified outline by more than `tolerance` (in degrees). Runs of points
+# within one tolerance-sized grid cell are first collapsed to one.
+def simplify_ring(points, tolerance):
+    if len(points) <= 4:
+        return points
+    cells = np.floor(points / tolerance)
+    moved = np.ones(len(points), dtype=bool)
+    moved[1:] = (cells[1:] != cells[:-1]).any(axis=1)
+    moved[-1] = True
+    points = points[moved]
+    if len(points) <= 4:
+        return points
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        a, b = stack.pop()
+        if b <= a + 1:
+            continue
+        seg = points[b] - points[a]
+        rel = points[a + 1:b] - points[a]
+        norm = math.hypot(seg[0], seg[1])
+        if norm == 0:
+            dist = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            dist = np.abs(seg[0] * rel[:, 1] - seg[1] * rel[:, 0]) / norm
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            i += a + 1
+            keep[i] = True
+            stack += [(a, i), (i, b)]
+    return points[keep]
+
+
+# One Sutherland-Hodgman pass: keeps the part of an open ring on one side
+# of the line coordinate[axis] == limit, adding the points where it crosses
+def _clip_side(ring, axis, limit, above):
+    inside = (ring[:, axis] >= limit) == above
+    prev = np.roll(ring, 1, axis=0)
+    crosses = inside != np.roll(inside, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (limit - prev[:, axis]) / (ring[:, axis] - prev[:, axis])
+        crossing = prev + t[:, None] * (ring - prev)
+    crossing[:, axis] = limit
+    # Each vertex contributes its crossing point (if any), then itself (if inside)
+    counts = crosses.astype(np.int64) + inside
+    start = np.cumsum(counts) - counts
+    out = np.empty((counts.sum(), 2))
+    out[start[crosses]] = crossing[crosses]
+    out[(start + crosses)[inside]] = ring[inside]
+    return out
+
+
+# Clips a closed ring to a (west, south, east, north) box
+def clip_ring(points, bounds):
+    west, south, east, north = bounds
+    lo, hi = points.min(axis=0), points.max(axis=0)
+    if lo[0] >= west and lo[1] >= south and hi[0] <= east and hi[1] <= north:
+        return points
+    if hi[0] < west or lo[0] > east or hi[1] < south or lo[1] > north:
+        return np.empty((0, 2))
+    ring = points[:-1]
+    for axis, limit, above in ((0, west, True), (0, east, False), (1, south, True), (1, north, False)):
+        ring = _clip_side(ring, axis, limit, above)
+        if len(ring) < 3:
+            return np.empty((0, 2))
+    return np.vstack([ring, ring[:1]])
+
+
+def _polygons(geometry):
+    if geometry is None:
+        return []
+    if geometry["type"] == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry["type"] == "MultiPolygon":
+        return geometry["coordinates"]
+    return []
+
+
+def _state_of(properties):
+    return next((properties[k] for k in STATE_KEYS if properties.get(k)), None)
+
+
+# Boundary polygons simplified to about one pixel at each zoom level and cut
+# into that level's tiles. Features under two pixels across are left out of
+# the tile, so low zoom levels stay light however many districts are loaded.
+class TileIndex:
+    def __init__(self, features, zooms=ZOOMS):
+        self.zooms = list(zooms)
+        self.states = []
+        self.tiles = {}  # (zoom, x, y) -> [(feature number, [polygon rings])]
+        self.bbox = None
+        for no, feature in enumerate(features):
+            self.states.append(_state_of(feature.get("properties") or {}))
+            polygons = [[np.asarray(ring, dtype=np.float64)[:, :2] for ring in polygon]
+                        for polygon in _polygons(feature.get("geometry"))]
+            polygons = [polygon for polygon in polygons if polygon and len(polygon[0]) >= 4]
+            if not polygons:
+                continue
+            points = np.concatenate([polygon[0] for polygon in polygons])
+            bbox = (*points.min(axis=0), *points.max(axis=0))
+            self.bbox = bbox if self.bbox is None else (
+                min(self.bbox[0], bbox[0]), min(self.bbox[1], bbox[1]),
+                max(self.bbox[2], bbox[2]), max(self.bbox[3], bbox[3]),
+            )
+            # Each level is simplified from the next finer one, which has
+            # far fewer points than the source geometry
+            for zoom in sorted(self.zooms, reverse=True):
+                polygons = self._add(no, polygons, bbox, zoom)
+                if not polygons:
+                    break
+
+    def _add(self, no, polygons, bbox, zoom):
+        tolerance = 360 / (TILE_SIZE * 2 ** zoom)
+        if max(bbox[2] - bbox[0], bbox[3] - bbox[1]) < 2 * tolerance:
+            return []
+        simplified = []
+        for polygon in polygons:
+            rings = [simplify_ring(ring, tolerance) for ring in polygon]
+            if len(rings[0]) >= 4:
+                simplified.append([ring for ring in rings if len(ring) >= 4])
+        if not simplified:
+            return simplified
+        x0, y0, x1, y1 = tile_range(bbox, zoom)
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                bounds = tile_bounds(zoom, x, y)
+                clipped = []
+                for polygon in simplified:
+                    rings = [clip_ring(ring, bounds) for ring in polygon]
+                    if len(rings[0]) >= 4:
+                        clipped.append([ring for ring in rings if len(ring) >= 4])
+                if clipped:
+                    self.tiles.setdefault((zoom, x, y), []).append((no, clipped))
+        return simplified
+
+    # Writes one GeoJSON FeatureCollection per tile under root/{z}/{x}/{y}.json,
+    # including empty ones inside the extent so the map never requests a
+    # missing file. properties(no) gives the properties of feature `no`.
+    def write(self, root, properties):
+        for zoom in self.zooms:
+            decimals = max(2, math.ceil(-math.log10(360 / (TILE_SIZE * 2 ** zoom))) + 1)
+            x0, y0, x1, y1 = tile_range(self.bbox, zoom)
+            for x in range(x0, x1 + 1):
+                os.makedirs(os.path.join(root, str(zoom), str(x)), exist_ok=True)
+                for y in range(y0, y1 + 1):
+                    features = [{
+                        "type": "Feature",
+                        "properties": properties(no),
+                        "geometry": {"type": "MultiPolygon", "coordinates": [
+                            [np.round(ring, decimals).tolist() for ring in polygon] for polygon in polygons
+                        ]},
+                    } for no, polygons in self.tiles.get((zoom, x, y), [])]
+                    with open(os.path.join(root, str(zoom), str(x), f"{y}.json"), "w", encoding="utf-8") as f:
+                        json.dump({"type": "FeatureCollection", "features": features}, f, separators=(",", ":"))
+
+
+def _colors(values):
+    values = np.asarray(values, dtype=np.float64)
+    finite = np.isfinite(values)
+    if not finite.any():
+        return [NO_DATA] * len(values)
+    lo, hi = values[finite].min(), values[finite].max()
+    scaled = np.zeros(len(values)) if hi == lo else (np.nan_to_num(values) - lo) / (hi - lo)
+    bins = np.minimum((scaled * len(PALETTE)).astype(int), len(PALETTE) - 1)
+    return [[*PALETTE[b].tolist(), 200] if ok else NO_DATA for b, ok in zip(bins, finite)]
+
+
+# Per metric and year, each state's total over its cities and all sectors
+def state_values(cube):
+    states = [s for s in dict.fromkeys(cube.states) if isinstance(s, str)]
+    in_state = np.array([[s == state for s in cube.states] for state in states], dtype=np.float64)
+    totals = {m: in_state @ np.asarray(cube.values[m]).sum(axis=1) for m in ("gdp", "employment", "labour_force")}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = totals["employment"] / totals["labour_force"] * 100
+    return states, {"gdp": totals["gdp"], "employment_rate": rate}
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _tile_index(path, mtime):
+    with open(path, encoding="utf-8") as f:
+        return TileIndex(json.load(f)["features"])
+
+
+# Geometry is tiled once per boundaries file; colouring it per data version
+# only rewrites properties. Returns the tile directory name, or None when
+# there are no boundaries to draw.
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _publish(path, mtime, version):
+    index = _tile_index(path, mtime)
+    if index.bbox is None:
+        return None
+    cube = get_cube()
+    states, values = state_values(cube)
+    row = {s: i for i, s in enumerate(states)}
+    years = [int(y) for y in cube.years]
+    colors = {(m, j): _colors(v[:, j]) for m, v in values.items() for j in range(len(years))}
+
+    def properties(state):
+        i = row.get(state)
+        props = {"label": state or "Unknown"}
+        for m in values:
+            for j, year in enumerate(years):
+                props[f"{m}_{year}"] = NO_DATA if i is None else colors[m, j][i]
+        return props
+
+    by_state = {state: properties(state) for state in set(index.states)}
+
+    name = hashlib.sha1(repr((path, mtime, version)).encode()).hexdigest()[:12]
+    tmp = os.path.join(TILE_DIR, f".{name}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    index.write(tmp, lambda no: by_state[index.states[no]])
+    shutil.rmtree(os.path.join(TILE_DIR, name), ignore_errors=True)
+    os.rename(tmp, os.path.join(TILE_DIR, name))
+    # The previous set is kept for sessions whose map still points at it
+    published = sorted((n for n in os.listdir(TILE_DIR) if not n.startswith(".")),
+                       key=lambda n: os.path.getmtime(os.path.join(TILE_DIR, n)))
+    for old in published[:-2]:
+        if old != name:
+            shutil.rmtree(os.path.join(TILE_DIR, old), ignore_errors=True)
+    return name
+
+
+def publish_tiles(path=BOUNDARIES_FILE):
+    if not os.path.exists(path):
+        return None
+    return _publish(path, os.path.getmtime(path), cube_version())
+
+
+@st.cache_resource(show_spinner=False)
+def _city_points(path, mtime):
+    with open(path, encoding="utf-8") as f:
+        features = json.load(f)["features"]
+    return {f["properties"]["city"]: f["geometry"]["coordinates"] for f in features}
+
+
+# Choropleth of state totals (when boundaries are available) with the cities
+# on top, sized by GDP and coloured by `metric`, for one year of the cube
+def city_map(cube, metric="gdp", year=None, cities=None, sectors=None, height=480):
+    import pydeck as pdk
+
+    year = int(cube.years[-1]) if year is None else int(year)
+    points = _city_points(CITIES_FILE, os.path.getmtime(CITIES_FILE))
+    gdp = cube.table("gdp", "city", cities=cities, sectors=sectors, years=(year, year))
+    employed = cube.table("employment", "city", cities=cities, sectors=sectors, years=(year, year))
+    labour_force = cube.table("labour_force", "city", cities=cities, sectors=sectors, years=(year, year))
+    rate = employed / labour_force * 100
+    shown = [c for c in gdp.index if c in points]
+    values = (gdp if metric == "gdp" else rate)[shown]
+    records = [{
+        "city": city,
+        "label": f"{city}: GDP {gdp[city]:.2f} tn, employment {rate[city]:.1f}%",
+        "position": points[city],
+        "radius": 15000 + 60000 * math.sqrt(gdp[city] / max(gdp[shown].max(), 1e-9)),
+        "color": color,
+    } for city, color in zip(shown, _colors(values.to_numpy()))]
+
+    layers = []
+    tiles = publish_tiles()
+    if tiles:
+        base = st.get_option("server.baseUrlPath").strip("/")
+        index = _tile_index(BOUNDARIES_FILE, os.path.getmtime(BOUNDARIES_FILE))
+        layers.append(pdk.Layer(
+            "TileLayer",
+            data=f"{'/' + base if base else ''}/app/static/tiles/{tiles}/{{z}}/{{x}}/{{y}}.json",
+            min_zoom=index.zooms[0],
+            max_zoom=index.zooms[-1],
+            extent=list(index.bbox),
+            get_fill_color=f"properties.{metric}_{year}",
+            stroked=False,
+            pickable=True,
+            opacity=0.6,
+        ))
+    layers.append(pdk.Layer(
+        "ScatterplotLayer", data=records, get_position="position", get_radius="radius",
+        get_fill_color="color", pickable=True, stroked=True, get_line_color=[30, 30, 30], line_width_min_pixels=1,
+    ))
+    view = pdk.ViewState(latitude=22.5, longitude=80.0, zoom=3.8)
+    st.pydeck_chart(pdk.Deck(layers=layers, initial_view_state=view, map_style=None,
+                             tooltip={"text": "{label}"}), height=height)
+    st.caption(f"{METRICS[metric]} in {year}. Circle size shows GDP."
+               + (" Regions are shaded by their state's total." if tiles else ""))
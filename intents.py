@@ -0,0 +1,73 @@
+import json
+import os
+import re
+
+import streamlit as st
+
+INTENTS_FILE = os.path.join("data", "intents.json")
+TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+# Keyword -> intent matcher compiled once from the intents file
+# Keywords (single words or short phrases) are indexed by their token tuple,
+# so a message costs one tokenize plus a dict lookup per n-gram regardless of
+# how many intents exist. Every matching intent is scored by the summed weight
+# of its distinct keywords; ties go to the intent listed first in the file.
+class IntentMatcher:
+    def __init__(self, intents, default):
+        self.default = default
+        self.intents = intents
+        self.index = {}
+        self.max_ngram = 1
+        for rank, intent in enumerate(intents):
+            weight = intent.get("weight", 1)
+            for keyword in intent["keywords"]:
+                tokens = tuple(tokenize(keyword))
+                if tokens:
+                    self.index.setdefault(tokens, []).append((rank, weight))
+                    self.max_ngram = max(self.max_ngram, len(tokens))
+
+    @classmethod
+    def from_file(cls, path=INTENTS_FILE):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["intents"], data["default"])
+
+    # {intent rank: score} for every intent the message mentions
+    def scores(self, message):
+        tokens = tokenize(message)
+        seen = set()
+        scores = {}
+        for n in range(1, self.max_ngram + 1):
+            for i in range(len(tokens) - n + 1):
+                gram = tuple(tokens[i:i + n])
+                if gram in seen:
+                    continue
+                seen.add(gram)
+                for rank, weight in self.index.get(gram, ()):
+                    scores[rank] = scores.get(rank, 0) + weight
+        return scores
+
+    def match(self, message):
+        scores = self.scores(message)
+        if not scores:
+            return None
+        return self.intents[min(scores, key=lambda rank: (-scores[rank], rank))]
+
+    def respond(self, message):
+        intent = self.match(message)
+        return intent["response"] if intent else self.default
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_matcher(path, mtime):
+    return IntentMatcher.from_file(path)
+
+
+# Recompiled only when the intents file changes
+def get_intent_matcher(path=INTENTS_FILE):
+    return _load_matcher(path, os.path.getmtime(path))
@@ -0,0 +1,97 @@
+import base64
+import functools
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+# bcrypt work factor; every +1 doubles the cost of a login
+BCRYPT_ROUNDS = int(os.environ.get("GDPBI_BCRYPT_ROUNDS", "12"))
+# Upper bound on hashes computed at the same time across all sessions
+HASH_WORKERS = int(os.environ.get("GDPBI_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+VERIFY_CACHE_SIZE = 1024
+BCRYPT_MAX_BYTES = 72  # bcrypt rejects longer input
+
+_pool = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="gdpbi-hash")
+
+# Successful verifications, keyed on the stored hash and a keyed digest of the
+# password so plaintext passwords never stay in memory
+_verified = OrderedDict()
+_verified_lock = threading.Lock()
+_cache_key = secrets.token_bytes(32)
+
+
+def _legacy_sha256(password):
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+def _is_legacy(stored):
+    return len(stored) == 64 and not stored.startswith("$")
+
+
+def _rounds(stored):
+    try:
+        return int(stored.split("$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+# Passwords bcrypt cannot take whole are hashed down first; shorter ones are
+# passed as they are, so hashes made before this still verify
+def _secret(password):
+    secret = password.encode()
+    if len(secret) > BCRYPT_MAX_BYTES:
+        secret = base64.b64encode(hashlib.sha256(secret).digest())
+    return secret
+
+
+def _hash(password, rounds):
+    return bcrypt.hashpw(_secret(password), bcrypt.gensalt(rounds)).decode()
+
+
+# Checked against for unknown users, so they take as long as a wrong password
+@functools.lru_cache(maxsize=None)
+def _dummy_hash():
+    return _hash(secrets.token_urlsafe(16), BCRYPT_ROUNDS)
+
+
+def _check(password, stored):
+    if _is_legacy(stored):
+        return hmac.compare_digest(_legacy_sha256(password), stored)
+    try:
+        return bcrypt.checkpw(_secret(password), stored.encode())
+    except ValueError:
+        return False
+
+
+# Password hashing function
+def hash_password(password, rounds=None):
+    return _pool.submit(_hash, password, rounds or BCRYPT_ROUNDS).result()
+
+
+# Returns (matches, needs_rehash); needs_rehash is set for legacy SHA-256
+# digests and bcrypt hashes made with a different cost
+def verify_password(password, stored):
+    if not stored:
+        _pool.submit(_check, password, _dummy_hash()).result()
+        return False, False
+    key = (stored, hmac.new(_cache_key, password.encode(), hashlib.sha256).digest())
+    with _verified_lock:
+        if key in _verified:
+            _verified.move_to_end(key)
+            return True, False
+    ok = _pool.submit(_check, password, stored).result()
+    if not ok:
+        return False, False
+    needs_rehash = _is_legacy(stored) or _rounds(stored) != BCRYPT_ROUNDS
+    if not needs_rehash:
+        with _verified_lock:
+            _verified[key] = True
+            if len(_verified) > VERIFY_CACHE_SIZE:
+                _verified.popitem(last=False)
+    return True, needs_rehash
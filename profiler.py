@@ -0,0 +1,99 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+# Opt-in rerun instrumentation; when disabled timed() hands back one shared
+# no-op context manager and nothing else runs
+ENABLED = os.environ.get("GDPBI_PROFILE", "") not in ("", "0")
+LOG_FILE = os.environ.get("GDPBI_PROFILE_LOG", "profile.jsonl")
+PROM_FILE = os.environ.get("GDPBI_PROFILE_PROM")  # Prometheus text file, if set
+WINDOW = 1000  # samples kept per section for percentiles
+
+_NULL = nullcontext()
+_local = threading.local()
+_lock = threading.Lock()
+_samples = {}
+
+
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        timings = getattr(_local, "timings", None)
+        if timings is not None:
+            timings.append((self.name, (time.perf_counter() - self.start) * 1000))
+
+
+# Times the enclosed block as `name` in the current rerun
+def timed(name):
+    return _Timer(name) if ENABLED else _NULL
+
+
+def begin_rerun():
+    if ENABLED:
+        _local.timings = []
+        _local.start = time.perf_counter()
+
+
+# Closes the current rerun: folds its timings into the rolling windows and
+# appends them to the JSONL log
+def end_rerun(page=None):
+    if not ENABLED or getattr(_local, "timings", None) is None:
+        return
+    timings = _local.timings
+    timings.append(("rerun", (time.perf_counter() - _local.start) * 1000))
+    _local.timings = None
+    with _lock:
+        for name, ms in timings:
+            _samples.setdefault(name, deque(maxlen=WINDOW)).append(ms)
+        with open(LOG_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"ts": time.time(), "page": page, "timings": dict(timings)}) + "\n")
+        if PROM_FILE:
+            tmp = f"{PROM_FILE}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(_prometheus_text())
+            os.replace(tmp, PROM_FILE)
+
+
+def _percentile(values, q):
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def _summary():
+    rows = []
+    for name, window in sorted(_samples.items()):
+        values = sorted(window)
+        rows.append({"section": name, "count": len(values),
+                     "p50_ms": _percentile(values, 0.5), "p95_ms": _percentile(values, 0.95)})
+    return rows
+
+
+# Per-section sample count, p50 and p95 over the last WINDOW reruns
+def summary():
+    with _lock:
+        return _summary()
+
+
+def _prometheus_text():
+    lines = ["# TYPE gdpbi_section_ms summary"]
+    for row in _summary():
+        label = row["section"].replace("\\", "\\\\").replace('"', '\\"')
+        lines.append(f'gdpbi_section_ms{{section="{label}",quantile="0.5"}} {row["p50_ms"]:.3f}')
+        lines.append(f'gdpbi_section_ms{{section="{label}",quantile="0.95"}} {row["p95_ms"]:.3f}')
+        lines.append(f'gdpbi_section_ms_count{{section="{label}"}} {row["count"]}')
+    return "\n".join(lines) + "\n"
+
+
+def prometheus_text():
+    with _lock:
+        return _prometheus_text()
@@ -0,0 +1,138 @@
+import logging
+import os
+import threading
+import time
+
+import streamlit as st
+
+logger = logging.getLogger("gdpbi.auth")
+
+# Burst size and refill rate (attempts per second) for each limiter
+USER_BURST = int(os.environ.get("GDPBI_LOGIN_USER_BURST", "5"))
+USER_RATE = float(os.environ.get("GDPBI_LOGIN_USER_RATE", str(1 / 60)))
+CLIENT_BURST = int(os.environ.get("GDPBI_LOGIN_CLIENT_BURST", "20"))
+CLIENT_RATE = float(os.environ.get("GDPBI_LOGIN_CLIENT_RATE", str(1 / 6)))
+# Shared by all clients trying one username; it throttles instead of locking
+# out, so distributed guessing is capped without shutting the owner out
+ACCOUNT_BURST = int(os.environ.get("GDPBI_LOGIN_ACCOUNT_BURST", "30"))
+ACCOUNT_RATE = float(os.environ.get("GDPBI_LOGIN_ACCOUNT_RATE", str(1 / 10)))
+LOCKOUT = float(os.environ.get("GDPBI_LOGIN_LOCKOUT", "300"))  # seconds
+# Reverse proxies in front of the app that append to X-Forwarded-For
+TRUSTED_PROXIES = int(os.environ.get("GDPBI_TRUSTED_PROXIES", "0"))
+SWEEP_EVERY = 1024  # operations between expiry sweeps
+
+
+# In-memory token buckets keyed by any hashable
+# Each key holds a [tokens, updated, locked_until] list. A bucket that has
+# refilled completely carries no information, so the periodic sweep drops it
+# and memory only grows with keys seen recently.
+class TokenBucketLimiter:
+    def __init__(self, name, burst, rate, lockout=LOCKOUT):
+        self.name = name
+        self.burst = burst
+        self.rate = rate
+        self.lockout = lockout
+        self._buckets = {}
+        self._ops = 0
+        self._lock = threading.Lock()
+
+    def _refill(self, bucket, now):
+        bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+
+    def _sweep(self, now):
+        idle = self.burst / self.rate if self.rate else float("inf")
+        for key in [k for k, b in self._buckets.items() if now - b[1] >= idle and now >= b[2]]:
+            del self._buckets[key]
+
+    # Seconds until `key` may try again; 0 when an attempt is allowed
+    def retry_after(self, key, now=None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                return 0.0
+            if now < bucket[2]:
+                return bucket[2] - now
+            self._refill(bucket, now)
+            return 0.0 if bucket[0] >= 1 else (1 - bucket[0]) / self.rate
+
+    # Takes one token for `key`; an empty bucket locks the key out
+    def consume(self, key, now=None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._ops += 1
+            if self._ops % SWEEP_EVERY == 0:
+                self._sweep(now)
+            bucket = self._buckets.setdefault(key, [float(self.burst), now, 0.0])
+            if now < bucket[2]:
+                return False
+            self._refill(bucket, now)
+            if bucket[0] < 1:
+                return False
+            bucket[0] -= 1
+            if bucket[0] < 1 and self.lockout:
+                bucket[2] = now + self.lockout
+                logger.warning("Login lockout for %s %r for %.0f s", self.name, key, self.lockout)
+            return True
+
+    # Gives back a token spent on an attempt that turned out legitimate
+    def refund(self, key):
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket[0] = min(self.burst, bucket[0] + 1)
+                if bucket[0] >= 1:
+                    bucket[2] = 0.0
+
+    def reset(self, key):
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+# Per-username and per-client limits on login attempts
+# acquire() spends a token from both buckets before any password hash is
+# computed; a successful login clears the username's bucket and refunds the
+# client's token, so only failed attempts count against a client. Username
+# buckets are kept per client, so failed attempts from one address can lock
+# an account out for that address only, never for its owner elsewhere. On top
+# of that, every attempt on a username draws from one account bucket shared
+# by all clients, which caps guessing spread over many addresses.
+class LoginLimiter:
+    def __init__(self):
+        self.users = TokenBucketLimiter("user", USER_BURST, USER_RATE)
+        self.clients = TokenBucketLimiter("client", CLIENT_BURST, CLIENT_RATE)
+        self.accounts = TokenBucketLimiter("account", ACCOUNT_BURST, ACCOUNT_RATE, lockout=0)
+
+    # 0 when the attempt may go ahead, else seconds until the next one may
+    def acquire(self, username, client):
+        key = (username, client)
+        if self.clients.consume(client) and self.users.consume(key) and self.accounts.consume(username):
+            return 0.0
+        waits = (self.users.retry_after(key), self.clients.retry_after(client), self.accounts.retry_after(username))
+        return max(*waits, 1.0)
+
+    def record_success(self, username, client):
+        self.users.reset((username, client))
+        self.clients.refund(client)
+        self.accounts.refund(username)
+
+
+@st.cache_resource
+def get_login_limiter():
+    return LoginLimiter()
+
+
+# Address of the browser's client. X-Forwarded-For is only read behind
+# TRUSTED_PROXIES proxies, and then only the entry the outermost of them
+# appended: everything to its left is whatever the client chose to send.
+def client_id():
+    if TRUSTED_PROXIES:
+        headers = getattr(st.context, "headers", None) or {}
+        hops = [hop.strip() for hop in headers.get("X-Forwarded-For", "").split(",") if hop.strip()]
+        if len(hops) >= TRUSTED_PROXIES:
+            return hops[-TRUSTED_PROXIES]
+    return getattr(st.context, "ip_address", None) or "unknown"
@@ -0,0 +1,127 @@
+# Rebuilds the aggregate snapshot served to the dashboards from the raw
+# dataset, spreading the parse-and-aggregate work over a process pool.
+# Usage: python refresh.py [--data data/gdp_city_sector.csv] [--workers 4]
+import argparse
+import io
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from cube import CURRENT, SNAPSHOT_DIR, Cube, derived_metrics
+from dataset import COLUMNS, DATA_FILE, DTYPES, dataset_version
+
+KEEP = 3  # snapshots kept on disk, including the current one
+
+
+# Partitions are byte ranges of a CSV (aligned to line starts) or row groups
+# of a Parquet file, so every worker parses only its own slice
+def _partitions(path, count):
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        groups = list(range(pq.ParquetFile(path).num_row_groups))
+        return [("parquet", groups[i::count]) for i in range(count) if groups[i::count]]
+    size = os.path.getsize(path)
+    bounds = np.linspace(0, size, count + 1).astype(np.int64)
+    return [("csv", (int(a), int(b))) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+def _read_partition(path, part):
+    kind, spec = part
+    if kind == "parquet":
+        import pyarrow.parquet as pq
+
+        df = pq.ParquetFile(path).read_row_groups(spec, columns=COLUMNS).to_pandas()
+        return df.astype(DTYPES)
+    start, end = spec
+    with open(path, "rb") as f:
+        header = f.readline()
+        # A range owns every line that starts inside it
+        if start > 0:
+            f.seek(start - 1)
+            f.readline()
+        begin = max(f.tell(), len(header))
+        if begin >= end:
+            return None
+        f.seek(begin)
+        data = f.read(end - begin)
+        if data and not data.endswith(b"\n"):
+            data += f.readline()
+    return pd.read_csv(io.BytesIO(header + data), usecols=COLUMNS, dtype=DTYPES)
+
+
+def _aggregate(path, part):
+    df = _read_partition(path, part)
+    return Cube.from_frame(df) if df is not None and len(df) else None
+
+
+def build_cube(path, workers):
+    parts = _partitions(path, workers * 2)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        partials = [c for c in pool.map(_aggregate, [path] * len(parts), parts) if c is not None]
+    cube = partials[0]
+    for partial in partials[1:]:
+        cube = cube.merged(partial)
+    return cube
+
+
+# `source` is the (path, dataset_version) the cube was built from; readers
+# only serve the snapshot while the data file still has that version
+def write_snapshot(cube, source, root=SNAPSHOT_DIR):
+    os.makedirs(root, exist_ok=True)
+    name = time.strftime("%Y%m%dT%H%M%S") + f"-{os.getpid()}"
+    tmp = os.path.join(root, f".{name}.tmp")
+    os.makedirs(tmp)
+    for key, array in {**cube.values, **derived_metrics(cube.values)}.items():
+        np.save(os.path.join(tmp, f"{key}.npy"), np.ascontiguousarray(array, dtype=np.float64))
+    meta = {
+        "cities": [str(c) for c in cube.cities],
+        "states": [s if isinstance(s, str) else None for s in cube.states],
+        "sectors": [str(s) for s in cube.sectors],
+        "years": [int(y) for y in cube.years],
+        "source": {"path": os.path.realpath(source[0]), "version": list(source[1])},
+    }
+    with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.rename(tmp, os.path.join(root, name))
+
+    # Readers follow CURRENT; replacing it is the atomic switch-over
+    pointer = os.path.join(root, f".{CURRENT}.tmp")
+    with open(pointer, "w", encoding="utf-8") as f:
+        f.write(name)
+    os.replace(pointer, os.path.join(root, CURRENT))
+    _prune(root, name)
+    return name
+
+
+# Removes old snapshots; sessions that still map one keep working because
+# unlinked files stay readable while mapped
+def _prune(root, current):
+    names = sorted(n for n in os.listdir(root) if not n.startswith(".") and n != CURRENT and n != current)
+    for name in names[:max(0, len(names) - (KEEP - 1))]:
+        shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data", default=DATA_FILE)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--snapshots", default=SNAPSHOT_DIR)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    # Taken before reading, so a file changed mid-build leaves a stale snapshot
+    version = dataset_version(args.data)
+    cube = build_cube(args.data, args.workers)
+    name = write_snapshot(cube, (args.data, version), args.snapshots)
+    print(f"Snapshot {name}: {len(cube.cities)} cities x {len(cube.sectors)} sectors x "
+          f"{len(cube.years)} years in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import importlib
+
+import streamlit as st
+
+from user_store import is_admin
+from warmup import start_warmup
+
+# Page registry: menu entry -> (sidebar label, module)
+# Each module exposes render() and is only imported the first time its page
+# is selected; Python's module cache keeps it loaded for later reruns.
+PAGES = {
+    "Home": ("🏠 Home", "sections.home"),
+    "About": ("ℹ️ About", "sections.about"),
+    "Dashboards": ("📊 Dashboards", "sections.dashboards"),
+    "Insights and Analysis": ("📈 Insights & Analysis", "sections.insights"),
+    "Feedback": ("📝 Feedback", "sections.feedback"),
+    "Chatbot": ("🤖 Chatbot", "sections.chatbot"),
+    "Feedback Analytics": ("📋 Feedback Analytics", "sections.feedback_analytics"),
+}
+# Only listed for admin users
+ADMIN_PAGES = {"Feedback Analytics"}
+# Read the dataset, cube or intent index; they wait for the server warm-up
+WARM_PAGES = {"About", "Dashboards", "Insights and Analysis", "Chatbot"}
+
+
+def visible_pages(username):
+    return [name for name in PAGES if name not in ADMIN_PAGES or is_admin(username)]
+
+
+def page_label(name):
+    return PAGES[name][0] if name in PAGES else name
+
+
+def render_page(name):
+    if name in ADMIN_PAGES and not is_admin(st.session_state.get("current_user")):
+        st.error("You do not have access to this page.")
+        return
+    warmup = start_warmup()
+    if name in WARM_PAGES and not warmup.ready():
+        with st.spinner("Preparing data, this only happens after a restart..."):
+            warmup.wait()
+    if name in WARM_PAGES:
+        from cube import get_cube, is_stale
+
+        if is_stale(get_cube()):
+            st.caption("Showing the last refreshed figures; the data file has changed since and "
+                       "will be shown once the next refresh is published.")
+    importlib.import_module(PAGES[name][1]).render()
@@ -0,0 +1,81 @@
+import streamlit as st
+
+from cube import get_cube
+from geo import city_map
+
+
+# About Page
+def render():
+    # Title and Introduction
+    st.title("🌏 India's Economic Pulse: GDP & Employment Dashboard")
+
+    st.markdown("""
+    Welcome to the **India GDP Dashboard**! 🎉 This interactive platform provides an in-depth exploration of 
+    city-wise GDP 📈 and employment statistics 👩‍💼👨‍💻 across India, showcasing the nation's economic landscape in a dynamic and engaging way.
+    """)
+
+    # About Section
+    st.markdown("""
+    ### 🔍 **About the Dashboard**
+    This project highlights critical **sector-specific contributions** across **4 key sectors**:  
+    1️⃣ **Agriculture** 🌾  
+    2️⃣ **Industry** 🏭  
+    3️⃣ **Services** 🛠️  
+    4️⃣ **Technology** 💻  
+
+    Key **economic indicators** presented include:  
+    - 🧠 **Patents per 100K inhabitants** (e.g., Bengaluru: 15, Pune: 10).  
+    - 💰 **R&D expenditure** (₹1,200 crore in Hyderabad alone in 2023).  
+    - 📉 **Unemployment rates** (Youth unemployment: 18% nationally).  
+
+    The dashboard also focuses on **youth employment trends** and **sectoral distributions**, offering insights into how different industries impact employment opportunities for younger demographics.  
+
+    ---
+
+    ### ✨ **Key Highlights**
+    📌 **GDP Growth Trends**: Visualize city-level GDP growth across India, highlighting top performers like:  
+    - 🌟 Bengaluru: ₹15.5 lakh crore (2023)  
+    - 🌟 Delhi: ₹14.2 lakh crore (2023)  
+
+    📌 **Employment Statistics**:  
+    - **Youth unemployment**: 18% nationwide, with urban areas seeing a higher rate (22%).  
+    - **Sector-wise employment**: Services dominate in cities like Mumbai, accounting for 65% of employment.  
+
+    📌 **Sector Contributions**:  
+    - **Agriculture** 🌾: Major contributor in rural areas (30% GDP in some states).  
+    - **Industry** 🏭: Driving manufacturing hubs like Pune and Chennai.  
+    - **Services** 🛠️: Largest employment generator (65% GDP contribution in metros).  
+    - **Technology** 💻: Bengaluru leads, contributing 10% to the tech sector GDP nationwide.  
+
+    📌 **Economic Indicators**:  
+    - 📜 **Patents**: Bengaluru (15/100K), Hyderabad (12/100K).  
+    - 💸 **R&D Expenditure**: ₹3,500 crore annually in top cities.  
+
+    ---
+
+    ### 🎯 **Why This Dashboard?**
+    The primary goal of this initiative is to empower policymakers, analysts, and stakeholders with **actionable insights**. 🎯 By leveraging this data, decision-makers can:  
+    1. **Identify strengths** and **weaknesses**.  
+    2. Formulate **strategies** to foster economic growth and development 🚀.  
+    3. Pinpoint areas needing **intervention** to improve productivity and sustainability 🌱.  
+
+    ---
+
+    ### 📊 **Dashboard Features**
+    Explore various insights through the **interactive options** in the sidebar:  
+    - **GDP growth trends** 🌟.  
+    - **Employment statistics** 👷‍♂️👩‍💻.  
+    - Contributions from key sectors:  
+    - Agriculture 🌾  
+    - Industry 🏭  
+    - Services 🛠️  
+    - Technology 💻  
+    - Economic indicators, including:  
+    - 🧠 **Patents per 100K inhabitants**.  
+    - 💰 **R&D expenditures**.  
+
+    Navigate through the data and gain **valuable insights** into India's city-level economic trends. 📈🌏  
+    """)
+
+    st.markdown("### 🗺️ **City Map**")
+    city_map(get_cube(), height=400)
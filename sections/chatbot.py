@@ -0,0 +1,48 @@
+import streamlit as st
+
+from chat_history import PAGE_SIZE, get_chat_history
+from data_query import answer_question
+from intents import get_intent_matcher
+
+
+# Chatbot Page
+def render():
+    st.title("Chatbot Assistant")
+    st.markdown("""
+    Welcome to the chatbot assistant!  
+    Ask questions about the GDP Statistics Dashboard, features, or insights.  
+    """)
+    
+    history = get_chat_history()
+    if "chat_visible" not in st.session_state:
+        st.session_state["chat_visible"] = PAGE_SIZE
+
+    # Chat Interface
+    # st.chat_input only returns a value on the rerun it was submitted in, so
+    # unrelated reruns do not append the same question again
+    user_input = st.chat_input("Type your question here...")
+    if user_input:
+        # Save user message
+        history.append("user", user_input)
+        # Generate chatbot response: intents weighted above the default (issue
+        # reports, feedback, logout) win, then data questions are answered
+        # from the dataset, then the remaining intents are the fallback
+        matcher = get_intent_matcher()
+        intent = matcher.match(user_input)
+        if intent is not None and intent.get("weight", 1) > 1:
+            bot_response = intent["response"]
+        else:
+            bot_response = answer_question(user_input) or matcher.respond(user_input)
+        history.append("bot", bot_response)
+
+    # Older messages are only loaded on request
+    if len(history) > st.session_state["chat_visible"]:
+        if st.button("Show older messages"):
+            st.session_state["chat_visible"] += PAGE_SIZE
+
+    # Display the visible window of chat messages
+    for message in history.window(st.session_state["chat_visible"]):
+        if message["role"] == "user":
+            st.chat_message("user").write(message["content"])
+        else:
+            st.chat_message("assistant").write(message["content"])
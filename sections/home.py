@@ -0,0 +1,67 @@
+import streamlit as st
+
+from assets import show_image
+
+
+# Home Page
+def render():
+    st.title("Welcome to the GDP Statistics Dashboard")
+    show_image("Home Page.png", use_container_width=True)
+
+    # Title
+    st.title("🏠 Welcome to the Economic Dashboard!")
+
+    # Subtitle
+    st.subheader("🌏 A Comprehensive View of India's Economic Pulse")
+
+    # Overview Section
+    st.markdown("""
+    ### 📖 **Homepage Overview**
+    The homepage serves as the **gateway** to understanding India's economic health. It's designed to provide:  
+    - **High-level insights** into key metrics 📊.  
+    - A snapshot of trends driving the economy 🚀.  
+    - Easy navigation to deeper analyses through the dashboard features 🧭.  
+
+    ---
+
+    ### 🎯 **Purpose**
+    The homepage acts as your **starting point**, offering a quick overview of:  
+    - **Economic health** through key statistics.  
+    - Insights into **GDP growth** and **employment trends**.  
+    - Highlights from **key sectors** like agriculture 🌾, industry 🏭, services 🛠️, and technology 💻.  
+
+    This page sets the tone for exploring the intricate dynamics of India's evolving economy. 🌟  
+
+    ---
+
+    ### 🌟 **Features at a Glance**
+    1️⃣ **GDP Growth Rate** 📈:  
+    - Displays the **current GDP value** (e.g., ₹250 lakh crore in 2023) with a comparison to the **previous period** (growth rate: +6.5%).  
+    - **Color-coded indicators** to show performance trends:  
+        - 🟢 Positive Growth  
+        - 🔴 Negative Growth  
+
+    2️⃣ **Sector Performance** 🏭💻:  
+    - Highlights contributions from key sectors:  
+        - 🌾 **Agriculture**: ₹40 lakh crore (16% GDP contribution).  
+        - 🏭 **Industry**: ₹60 lakh crore (24% GDP contribution).  
+        - 🛠️ **Services**: ₹120 lakh crore (48% GDP contribution).  
+        - 💻 **Technology**: ₹30 lakh crore (12% GDP contribution).  
+    - Shows the **top-performing sectors** in the current quarter.
+
+    3️⃣ **Trending Metrics** 📊:  
+    - A **line graph** visualizing trends over time:  
+        - **GDP Growth**: Observe how GDP has evolved over the last 5 years.  
+        - **Employment Trends**: Track changes in employment rates across cities.  
+    - Compare **city-level trends** for actionable insights.
+
+    ---
+
+    ### 🔑 **Why Explore This Dashboard?**
+    This homepage offers a clear and concise introduction, ensuring you:  
+    - Stay updated on the **latest economic metrics** 📰.  
+    - Understand the **drivers of growth** across India 🚀.  
+    - Navigate easily to **deeper data insights** within the dashboard.
+
+    🔎 **Dive deeper** by exploring interactive features in the sidebar!  
+    """)
@@ -0,0 +1,113 @@
+import pandas as pd
+import streamlit as st
+
+from charts import forecast_chart, line_chart
+from cube import employment_rate_by_year, gdp_by_year, get_cube, sector_summary
+from export import download_button
+from forecast import HORIZON, get_forecaster
+
+
+# One sentence on the GDP series under the trend chart: overall change and,
+# if it is not at either end, the year of the low point
+def trend_summary(history):
+    history = history.dropna()
+    if len(history) < 2 or history.iloc[0] <= 0:
+        return None
+    first, last = history.index[0], history.index[-1]
+    change = (history.iloc[-1] / history.iloc[0] - 1) * 100
+    text = f"GDP {'grew' if change >= 0 else 'fell'} {abs(change):.1f}% from {first} to {last}"
+    low = history.idxmin()
+    if first < low < last:
+        text += f", with its low point in {low}"
+    return text + "."
+
+
+# Insights and Analysis Page
+def render():
+    st.title("📊 GDP Insights")
+    st.markdown("""
+    ## Economic Overview
+    Explore the latest economic statistics and trends through detailed visualizations and summary cards.
+    """)
+    
+    # Read from the same cube as the Dashboards, so both pages agree
+    cube = get_cube()
+    gdp = gdp_by_year(cube)
+    growth = gdp.pct_change() * 100
+    employment_rate = employment_rate_by_year(cube)
+    sectors = sector_summary(cube)
+
+    # Display Key Statistics as Cards
+    st.markdown("### Key Economic Statistics")
+    col1, col2, col3 = st.columns(3)
+    # Growth needs two years of data and its change three
+    with col1:
+        if len(gdp) > 1:
+            delta = f"{growth.iloc[-1] - growth.iloc[-2]:+.1f}%" if len(gdp) > 2 else None
+            st.metric("GDP Growth Rate", f"{growth.iloc[-1]:.1f}%", delta)
+        else:
+            st.metric("GDP Growth Rate", "n/a")
+        st.caption("Year-over-year growth.")
+    with col2:
+        delta = f"{employment_rate.iloc[-1] - employment_rate.iloc[-2]:+.1f}%" if len(employment_rate) > 1 else None
+        st.metric("Employment Rate", f"{employment_rate.iloc[-1]:.1f}%", delta)
+        st.caption("Percentage of the workforce employed.")
+    with col3:
+        st.metric("Inflation Rate", "4.1%", "⬇ 0.2%")
+        st.caption("Year-over-year price change.")
+    
+    st.markdown("---")
+    
+    # Sector Performance
+    st.markdown("### Sector Performance")
+    st.markdown("""
+    Analyze the contributions of various sectors to the GDP. The performance indicators highlight the economic health of major industries.
+    """)
+    
+    # Sector Statistics Table
+    st.table(sectors.set_index("Sector"))
+    
+    st.markdown("---")
+    
+    # Trend Analysis
+    st.markdown("### GDP Trend Analysis")
+    col1, col2 = st.columns(2)
+    with col1:
+        city = st.selectbox("City", ["All cities", *cube.cities], key="trend_city")
+    with col2:
+        sector = st.selectbox("Sector", ["All sectors", *cube.sectors], key="trend_sector")
+    city = None if city == "All cities" else city
+    sector = None if sector == "All sectors" else sector
+    history = cube.table("gdp", "year", cities=[city] if city else None, sectors=[sector] if sector else None)
+
+    # Projections are fitted once per dataset version in the background;
+    # changing the selection above only looks them up
+    forecaster = get_forecaster()
+    ready = forecaster.done.is_set()
+    if ready and forecaster.result is not None:
+        forecast_chart(history, forecaster.result.series(city, sector))
+        st.caption(f"Dashed line: log-linear trend projected {HORIZON} years ahead, "
+                   "with its 95% prediction interval shaded.")
+    else:
+        line_chart(history.rename("GDP (in Trillions)").rename_axis("Year"))
+        if not ready:
+            st.caption("Projections are still being computed and will appear on the next refresh.")
+    
+    summary = trend_summary(history)
+    if summary:
+        st.markdown(summary)
+    download_button("insights", cities=[city] if city else None, sectors=[sector] if sector else None)
+
+    st.markdown("---")
+    
+    # Insights
+    largest = sectors.iloc[0]
+    fastest = sectors.sort_values("Growth Rate (%)", ascending=False).iloc[0]
+    st.markdown("### Insights")
+    growth_line = (f"- The **{fastest['Sector']} sector** is showing the strongest growth, at {fastest['Growth Rate (%)']:.1f}%."
+                   if pd.notna(fastest["Growth Rate (%)"]) else "")
+    st.markdown(f"""
+    - The **{largest['Sector']} sector** remains the backbone of the economy, contributing {largest['Contribution to GDP (%)']:.1f}% of the GDP.
+    {growth_line}
+    - The **Inflation rate** has seen a decline, indicating stability in consumer prices.
+    """)
@@ -0,0 +1,49 @@
+# Serves the app together with the HTTP routes it adds to Streamlit: exports
+# streamed from disk at any size, and GET /ready for load-balancer probes,
+# which answers 503 until warm-up has loaded everything. Warm-up starts with
+# the server process, before any browser connects, and a stale ready file
+# from an earlier process is removed first. Use instead of
+# `streamlit run gdpbi.py`; extra arguments are passed through:
+#   python serve.py --server.port 8501 --server.headless true
+# or run it under any ASGI server, e.g. `uvicorn serve:app`.
+import contextlib
+import os
+import sys
+
+import streamlit as st
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from streamlit.web import cli
+
+from export import export_routes
+from warmup import start_warmup
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(HERE, "gdpbi.py")
+
+
+# Runs once the Streamlit runtime has started, so st.cache_resource and
+# st.cache_data entries made by the warm-up are shared with every session
+@contextlib.asynccontextmanager
+async def _lifespan(app):
+    start_warmup()
+    yield
+
+
+async def _ready(request):
+    warmup = start_warmup()
+    if warmup.healthy():
+        return PlainTextResponse("ready\n")
+    return PlainTextResponse("failed\n" if warmup.ready() else "warming up\n", status_code=503)
+
+
+app = st.App(APP, routes=[Route("/ready", _ready, methods=["GET"]), *export_routes()], lifespan=_lifespan)
+
+
+def main():
+    sys.argv = ["streamlit", "run", os.path.abspath(__file__), *sys.argv[1:]]
+    sys.exit(cli.main())
+
+
+if __name__ == "__main__":
+    main()
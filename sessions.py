@@ -0,0 +1,163 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+
+import streamlit as st
+
+# Without a configured secret, tokens are only valid for this server process
+SESSION_SECRET = os.environ.get("GDPBI_SESSION_SECRET", "").encode() or secrets.token_bytes(32)
+IDLE_TTL = float(os.environ.get("GDPBI_SESSION_TTL", str(30 * 60)))  # seconds
+MAX_SESSIONS = int(os.environ.get("GDPBI_MAX_SESSIONS", "10000"))
+MAX_SESSION_BYTES = int(os.environ.get("GDPBI_MAX_SESSION_BYTES", str(2 * 1024 * 1024)))
+COOKIE_NAME = "gdpbi_session"
+TOKEN_PARAM = "session"  # where tokens used to be kept, in the URL
+
+
+# Approximate deep size of an object graph in bytes
+def sizeof(obj, seen=None):
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(sizeof(k, seen) + sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(sizeof(v, seen) for v in obj)
+    elif hasattr(obj, "__dict__"):
+        size += sizeof(vars(obj), seen)
+    return size
+
+
+class Session:
+    def __init__(self, user):
+        self.user = user
+        self.created = self.last_seen = time.time()
+        self.data = {}
+        self.bytes = 0
+
+
+# Process-wide store of logged-in sessions
+# Sessions are kept in an OrderedDict ordered by last activity, so idle-TTL
+# expiry and LRU eviction both pop from the front. Each session's data is
+# measured when it is touched; keys are dropped oldest-first while it is over
+# MAX_SESSION_BYTES.
+class SessionManager:
+    def __init__(self, secret=SESSION_SECRET, idle_ttl=IDLE_TTL, max_sessions=MAX_SESSIONS,
+                 max_bytes=MAX_SESSION_BYTES):
+        self.secret = secret
+        self.idle_ttl = idle_ttl
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _sign(self, session_id):
+        digest = hmac.new(self.secret, session_id.encode(), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest[:18]).decode()
+
+    def _session_id(self, token):
+        session_id, _, signature = (token or "").partition(".")
+        if session_id and hmac.compare_digest(signature, self._sign(session_id)):
+            return session_id
+        return None
+
+    def _evict(self, session_id):
+        session = self._sessions.pop(session_id)
+        for value in session.data.values():
+            close = getattr(value, "close", None)
+            if callable(close):
+                close()
+
+    def _sweep(self, now):
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if now - session.last_seen <= self.idle_ttl and len(self._sessions) <= self.max_sessions:
+                break
+            self._evict(session_id)
+
+    def _charge(self, session):
+        session.bytes = sizeof(session.data)
+        while session.bytes > self.max_bytes and session.data:
+            close = getattr(session.data.pop(next(iter(session.data))), "close", None)
+            if callable(close):
+                close()
+            session.bytes = sizeof(session.data)
+
+    # Starts a session for an authenticated user and returns its signed token
+    def create(self, user):
+        session_id = secrets.token_urlsafe(16)
+        with self._lock:
+            self._sessions[session_id] = Session(user)
+            self._sweep(time.time())
+        return f"{session_id}.{self._sign(session_id)}"
+
+    # Returns the live session for a token, refreshing its idle timer, or None
+    def touch(self, token):
+        session_id = self._session_id(token)
+        now = time.time()
+        with self._lock:
+            self._sweep(now)
+            session = self._sessions.get(session_id) if session_id else None
+            if session is None:
+                return None
+            session.last_seen = now
+            self._sessions.move_to_end(session_id)
+            self._charge(session)
+            return session
+
+    def drop(self, token):
+        session_id = self._session_id(token)
+        with self._lock:
+            if session_id in self._sessions:
+                self._evict(session_id)
+
+    def metrics(self):
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "bytes": sum(s.bytes for s in self._sessions.values()),
+            }
+
+
+@st.cache_resource
+def get_session_manager():
+    return SessionManager()
+
+
+# Token of the browser tab's session. It is kept in a cookie, so a reload
+# keeps the login while copied links, history and screenshots carry none.
+# st.context.cookies only holds what the browser sent when the tab connected,
+# so a login or logout since then is read from st.session_state instead.
+def current_token():
+    if TOKEN_PARAM in st.query_params:
+        del st.query_params[TOKEN_PARAM]
+    if "session_token" in st.session_state:
+        return st.session_state["session_token"]
+    return st.context.cookies.to_dict().get(COOKIE_NAME)
+
+
+# Streamlit has no response to set a header on, so the cookie is written by a
+# script on the page; None clears it. That also means it cannot be HttpOnly.
+def remember_token(token):
+    st.session_state["session_token"] = token
+    cookie = json.dumps(f"{COOKIE_NAME}={token}" if token else f"{COOKIE_NAME}=; Max-Age=0")
+    st.html(
+        f"<script>document.cookie = {cookie} + '; Path=/; SameSite=Strict'"
+        " + (location.protocol === 'https:' ? '; Secure' : '');</script>",
+        unsafe_allow_javascript=True,
+    )
+
+
+# Server-side data of the current session, falling back to st.session_state
+# before login
+def session_data():
+    session = st.session_state.get("server_session")
+    return session.data if session is not None else st.session_state
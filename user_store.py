@@ -0,0 +1,84 @@
+import csv
+import os
+import threading
+
+import streamlit as st
+
+USERS_FILE = "users.csv"
+FIELDS = ["username", "password", "dob"]
+ADMIN_USERS = set(os.environ.get("GDPBI_ADMIN_USERS", "admin").split(","))
+
+
+# Process-wide user store backed by users.csv
+# Rows are only ever appended; when a username appears more than once the
+# last row wins, so password updates never rewrite the whole file.
+class UserStore:
+    def __init__(self, path=USERS_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._users = {}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            with open(self.path, "w", newline="") as f:
+                csv.writer(f).writerow(FIELDS)
+            return
+        with open(self.path, newline="") as f:
+            for row in csv.DictReader(f):
+                if row.get("username"):
+                    self._users[row["username"]] = {
+                        "password": row.get("password") or "",
+                        "dob": row.get("dob") or "",
+                    }
+        # Make sure appended rows start on their own line
+        with open(self.path, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    def _append(self, username, password, dob):
+        with open(self.path, "a", newline="") as f:
+            csv.writer(f).writerow([username, password, dob])
+            f.flush()
+            os.fsync(f.fileno())
+
+    def __contains__(self, username):
+        return username in self._users
+
+    def __len__(self):
+        return len(self._users)
+
+    def get_password(self, username):
+        user = self._users.get(username)
+        return user["password"] if user else None
+
+    # Returns False if the username is already taken
+    def add_user(self, username, password, dob=""):
+        with self._lock:
+            if username in self._users:
+                return False
+            self._append(username, password, dob)
+            self._users[username] = {"password": password, "dob": dob}
+            return True
+
+    def set_password(self, username, password):
+        with self._lock:
+            dob = self._users.get(username, {}).get("dob", "")
+            self._append(username, password, dob)
+            self._users[username] = {"password": password, "dob": dob}
+
+    # In-memory only, used for built-in accounts that should not be written to disk
+    def seed(self, username, password):
+        with self._lock:
+            self._users.setdefault(username, {"password": password, "dob": ""})
+
+
+def is_admin(username):
+    return username in ADMIN_USERS
+
+
+# Loaded once per server process and shared by every session
+@st.cache_resource
+def get_user_store():
+    return UserStore()
@@ -0,0 +1,132 @@
+import logging
+import os
+import threading
+import time
+
+import streamlit as st
+
+logger = logging.getLogger("gdpbi.warmup")
+
+# Written once warm-up has finished, for a file-based readiness probe; serve.py
+# also answers GET /ready over HTTP
+READY_FILE = os.environ.get("GDPBI_READY_FILE", ".gdpbi-ready")
+ASSETS = ["styles.css", "Home Page.png"]
+WAIT_TIMEOUT = 60  # seconds a page waits for warm-up before rendering anyway
+
+
+# Heavy modules are imported inside the steps so the warm-up thread, not the
+# first script run, pays for them
+def _assets():
+    from assets import load_image, load_text
+
+    for path in ASSETS:
+        if os.path.exists(path):
+            (load_text if path.endswith(".css") else load_image)(path)
+
+
+def _data():
+    from dataset import load_dataset
+
+    load_dataset()
+
+
+def _pages():
+    import importlib
+
+    from sections import PAGES
+
+    for _, module in PAGES.values():
+        importlib.import_module(module)
+
+
+def _cube():
+    from cube import get_cube
+
+    get_cube().insights()
+
+
+def _forecast():
+    from forecast import get_forecaster
+
+    get_forecaster().done.wait()
+
+
+def _map_tiles():
+    from geo import publish_tiles
+
+    publish_tiles()
+
+
+def _intents():
+    from intents import get_intent_matcher
+
+    get_intent_matcher()
+
+
+STEPS = [
+    ("assets", _assets),
+    ("pages", _pages),
+    ("dataset", _data),
+    ("cube", _cube),
+    ("forecast", _forecast),
+    ("map tiles", _map_tiles),
+    ("intents", _intents),
+]
+# Steps the app cannot serve without: if one fails, the process is never
+# reported ready
+REQUIRED = {"dataset", "cube", "intents"}
+
+
+# Background warm-up of caches shared by every session
+# Each step fills the same process-wide caches the pages read from, so once it
+# is done no session pays for cold loads. A failing step is logged and skipped;
+# the page that needs it then loads it on demand as before. Pages stop waiting
+# once warm-up is done either way, but a failed REQUIRED step keeps the
+# process from reporting itself ready.
+class Warmup:
+    def __init__(self, steps=STEPS, ready_file=READY_FILE):
+        self.steps = steps
+        self.ready_file = ready_file
+        self.timings = {}
+        self.failed = []
+        self.done = threading.Event()
+        if os.path.exists(ready_file):
+            os.remove(ready_file)
+        self._thread = threading.Thread(target=self._run, name="gdpbi-warmup", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        for name, step in self.steps:
+            start = time.perf_counter()
+            try:
+                step()
+            except Exception:
+                logger.exception("Warm-up step %r failed", name)
+                self.failed.append(name)
+            self.timings[name] = (time.perf_counter() - start) * 1000
+        missing = REQUIRED.intersection(self.failed)
+        if not missing:
+            # The PID lets a probe tell this process's file from a stale one
+            with open(self.ready_file, "w", encoding="utf-8") as f:
+                f.write(f"{os.getpid()} {time.time()}\n")
+        else:
+            logger.error("Not reporting ready: warm-up of %s failed", ", ".join(sorted(missing)))
+        self.done.set()
+        logger.info("Warm-up finished: %s", ", ".join(f"{k} {v:.0f} ms" for k, v in self.timings.items()))
+
+    def ready(self):
+        return self.done.is_set()
+
+    # Finished, with every REQUIRED step loaded
+    def healthy(self):
+        return self.done.is_set() and not REQUIRED.intersection(self.failed)
+
+    def wait(self, timeout=WAIT_TIMEOUT):
+        return self.done.wait(timeout)
+
+
+# Started by serve.py as soon as the server process is up, or otherwise by
+# the first script run
+@st.cache_resource
+def start_warmup():
+    return Warmup()